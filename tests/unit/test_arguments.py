@@ -1,5 +1,7 @@
+import tempfile
 import tracemalloc
 import unittest
+from pathlib import Path
 
 from twitcharchiver import Arguments
 
@@ -18,6 +20,27 @@ class TestArguments(unittest.TestCase):
         args.extract_vods_and_channels("vod_id")
         self.assertEqual(["637408411", "639404719", "623893787"], args.get("vod_id"))
 
+    def test_extract_channels(self):
+        args = Arguments()
+        args.set("file", False)
+        args.set("channel", "https://www.twitch.tv/some_user42,twitch.tv/other,third")
+        args.extract_vods_and_channels("channel")
+        self.assertEqual(["some_user42", "other", "third"], args.get("channel"))
+
+    def test_extract_vods_from_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vod_file = Path(temp_dir, "vods.txt")
+            vod_file.write_text(
+                "https://twitch.tv/videos/637408411\n639404719,623893787\n\n"
+            )
+
+            args = Arguments()
+            args.set("file", True)
+            args.set("vod_id", str(vod_file))
+            args.extract_vods_and_channels("vod_id")
+
+        self.assertEqual(["637408411", "639404719", "623893787"], args.get("vod_id"))
+
 
 if __name__ == "__main__":
     unittest.main()
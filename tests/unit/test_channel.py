@@ -1,8 +1,10 @@
 import tracemalloc
 import unittest
+from unittest import mock
 
-from twitcharchiver.channel import Channel
+from twitcharchiver.channel import Channel, VIDEO_LIST_REFRESH_INTERVAL
 from twitcharchiver.exceptions import StreamOfflineError
+from twitcharchiver.vod import Vod
 
 
 class TestChannel(unittest.TestCase):
@@ -42,5 +44,167 @@ class TestChannel(unittest.TestCase):
         self.assertEqual(745, len(self.channel_b.get_channel_videos()))
 
 
+class TestChannelVideos(unittest.TestCase):
+    def setUp(self) -> None:
+        self.channel = Channel(
+            owner={"id": "1", "login": "test", "displayName": "Test", "stream": None}
+        )
+        self.channel._api = mock.Mock()
+
+        # VODs from a previous full listing
+        self.page_a = mock.Mock()
+        self.page_a.json.return_value = [
+            {
+                "data": {
+                    "user": {
+                        "videos": {
+                            "edges": [
+                                {
+                                    "cursor": "5",
+                                    "node": {
+                                        "id": "5",
+                                        "game": None,
+                                        "lengthSeconds": 60,
+                                        "publishedAt": "2023-01-01T00:00:00Z",
+                                        "previewThumbnailURL": "",
+                                        "title": "VOD 5",
+                                        "viewCount": 0,
+                                    },
+                                },
+                                {
+                                    "cursor": "4",
+                                    "node": {
+                                        "id": "4",
+                                        "game": None,
+                                        "lengthSeconds": 60,
+                                        "publishedAt": "2023-01-01T00:00:00Z",
+                                        "previewThumbnailURL": "",
+                                        "title": "VOD 4",
+                                        "viewCount": 0,
+                                    },
+                                },
+                            ],
+                            "pageInfo": {"hasNextPage": True},
+                        }
+                    }
+                }
+            }
+        ]
+        self.page_b = mock.Mock()
+        self.page_b.json.return_value = [
+            {
+                "data": {
+                    "user": {
+                        "videos": {
+                            "edges": [
+                                {
+                                    "cursor": "3",
+                                    "node": {
+                                        "id": "3",
+                                        "game": None,
+                                        "lengthSeconds": 60,
+                                        "publishedAt": "2023-01-01T00:00:00Z",
+                                        "previewThumbnailURL": "",
+                                        "title": "VOD 3",
+                                        "viewCount": 0,
+                                    },
+                                },
+                            ],
+                            "pageInfo": {"hasNextPage": False},
+                        }
+                    }
+                }
+            }
+        ]
+        # a new VOD followed by one from the previous listing
+        self.page_new = mock.Mock()
+        self.page_new.json.return_value = [
+            {
+                "data": {
+                    "user": {
+                        "videos": {
+                            "edges": [
+                                {
+                                    "cursor": "6",
+                                    "node": {
+                                        "id": "6",
+                                        "game": None,
+                                        "lengthSeconds": 60,
+                                        "publishedAt": "2023-01-01T00:00:00Z",
+                                        "previewThumbnailURL": "",
+                                        "title": "VOD 6",
+                                        "viewCount": 0,
+                                    },
+                                },
+                                {
+                                    "cursor": "5",
+                                    "node": {
+                                        "id": "5",
+                                        "game": None,
+                                        "lengthSeconds": 60,
+                                        "publishedAt": "2023-01-01T00:00:00Z",
+                                        "previewThumbnailURL": "",
+                                        "title": "VOD 5",
+                                        "viewCount": 0,
+                                    },
+                                },
+                            ],
+                            "pageInfo": {"hasNextPage": True},
+                        }
+                    }
+                }
+            }
+        ]
+
+    def test_get_channel_videos(self):
+        self.channel._api.gql_request.side_effect = [self.page_a, self.page_b]
+
+        self.assertEqual([5, 4, 3], [v.v_id for v in self.channel.get_channel_videos()])
+        self.assertEqual(2, self.channel._api.gql_request.call_count)
+
+    def test_get_channel_videos_stops_at_known_vod(self):
+        self.channel._api.gql_request.side_effect = [
+            self.page_a,
+            self.page_b,
+            self.page_new,
+        ]
+        self.channel.get_channel_videos()
+
+        self.assertEqual(
+            [6, 5, 4, 3], [v.v_id for v in self.channel.get_channel_videos()]
+        )
+        # only the first page is retrieved as it contains a VOD from the previous listing
+        self.assertEqual(3, self.channel._api.gql_request.call_count)
+
+    def test_get_channel_videos_refreshes_expired_listing(self):
+        self.channel._api.gql_request.side_effect = [
+            self.page_a,
+            self.page_b,
+            self.page_new,
+            self.page_b,
+        ]
+        self.channel.get_channel_videos()
+        self.channel._videos_updated -= VIDEO_LIST_REFRESH_INTERVAL
+
+        # every page is retrieved again, so the deleted VOD (4) is no longer returned
+        self.assertEqual([6, 5, 3], [v.v_id for v in self.channel.get_channel_videos()])
+        self.assertEqual(4, self.channel._api.gql_request.call_count)
+
+    def test_get_channel_videos_returns_copy(self):
+        self.channel._api.gql_request.side_effect = [
+            self.page_a,
+            self.page_b,
+            self.page_new,
+        ]
+        # a stream's VOD added to the returned list shouldn't be added to the stored listing
+        _stream_vod = Vod()
+        _stream_vod.v_id = 7
+        self.channel.get_channel_videos().insert(0, _stream_vod)
+
+        self.assertEqual(
+            [6, 5, 4, 3], [v.v_id for v in self.channel.get_channel_videos()]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from twitcharchiver.utils import (
+    parse_twitch_timestamp,
+    sanitize_text,
+    write_file_line_by_line,
+)
+
+
+class TestUtils(unittest.TestCase):
+    def test_parse_twitch_timestamp(self):
+        self.assertEqual(1672531200.0, parse_twitch_timestamp("2023-01-01T00:00:00Z"))
+
+    def test_parse_twitch_timestamp_fractional_seconds(self):
+        self.assertEqual(1672531200.5, parse_twitch_timestamp("2023-01-01T00:00:00.5Z"))
+        self.assertEqual(
+            1672531200.123, parse_twitch_timestamp("2023-01-01T00:00:00.123Z")
+        )
+        self.assertEqual(
+            1672531200.123456, parse_twitch_timestamp("2023-01-01T00:00:00.123456Z")
+        )
+
+    def test_parse_twitch_timestamp_without_timezone(self):
+        with self.assertRaises(ValueError):
+            parse_twitch_timestamp("2023-01-01T00:00:00")
+
+        with self.assertRaises(ValueError):
+            parse_twitch_timestamp("2023-01-01T00:00:00.123")
+
+    def test_sanitize_text(self):
+        self.assertEqual(
+            "a_b_c_d_e_f_g_h_i_j_k", sanitize_text("a/b\\c:d|e<f>g\"h?i*j'k")
+        )
+        self.assertEqual("line_break_tab_", sanitize_text("line\nbreak\ttab\x00"))
+        self.assertEqual(
+            "Normal title - 100% [ok]", sanitize_text("Normal title - 100% [ok]")
+        )
+        self.assertEqual("", sanitize_text(""))
+        self.assertEqual("", sanitize_text(None))
+
+    def test_write_file_line_by_line(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _file = Path(temp_dir, "lines.txt")
+
+            self.assertTrue(write_file_line_by_line(["a", "b"], _file))
+            self.assertEqual("a\nb\n", _file.read_text(encoding="utf-8"))
+
+            # appending keeps existing lines
+            self.assertTrue(write_file_line_by_line(["c"], _file, append=True))
+            self.assertEqual("a\nb\nc\n", _file.read_text(encoding="utf-8"))
+
+            # overwriting truncates existing lines
+            self.assertTrue(write_file_line_by_line(["d"], _file))
+            self.assertEqual("d\n", _file.read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from twitcharchiver.downloaders.video import Video
+from twitcharchiver.vod import Vod
+
+
+def build_playlist(segments: list):
+    """
+    Builds a VOD playlist containing the provided segment uris.
+    """
+    _playlist = "#EXTM3U\n#EXT-X-TWITCH-TOTAL-SECS:%s\n" % (len(segments) * 10)
+    for _segment in segments:
+        _playlist += f"#EXTINF:10.000,\n{_segment}\n"
+
+    return _playlist
+
+
+class TestVideo(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        _vod = Vod()
+        _vod.title = "test"
+        _vod.created_at = 0
+
+        self.video = Video(_vod, Path(self.temp_dir.name), quiet=True)
+        self.video._api = mock.Mock()
+        self.video._index_url = "https://example.com/abc/chunked/index-dvr.m3u8"
+        self.video._base_url = "https://example.com/abc/chunked/"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def refresh(self, segments: list):
+        self.video._api.get_request.return_value = mock.Mock(
+            status_code=200, headers={}, text=build_playlist(segments)
+        )
+        self.video.refresh_playlist()
+
+    def test_refresh_playlist_segment_muted_in_place(self):
+        self.refresh(["0.ts", "1.ts", "2.ts"])
+        _unmuted = self.video._index_segments
+
+        self.assertFalse(_unmuted[1].muted)
+
+        # same number of segments, but segment 1 has been muted
+        self.refresh(["0.ts", "1-muted.ts", "2.ts"])
+        _muted = self.video._index_segments
+
+        self.assertEqual(3, len(_muted))
+        self.assertTrue(_muted[1].muted)
+        self.assertEqual("https://example.com/abc/chunked/1-muted.ts", _muted[1].url)
+        # unchanged segments are reused rather than converted again
+        self.assertIs(_unmuted[0], _muted[0])
+        self.assertIs(_unmuted[2], _muted[2])
+
+    def test_refresh_playlist_segments_appended(self):
+        self.refresh(["0.ts", "1.ts"])
+        self.refresh(["0.ts", "1.ts", "2.ts"])
+
+        self.assertEqual([0, 1, 2], [_s.id for _s in self.video._index_segments])
+        self.assertEqual(3, len(self.video._index_playlist.segments))
+        self.assertEqual(30, self.video.vod.duration)
+
+    def test_extract_base_url(self):
+        self.assertEqual(
+            "https://d2nvs31859zcd8.cloudfront.net/abc_123_456/chunked/",
+            Video._extract_base_url(
+                "https://d2nvs31859zcd8.cloudfront.net/abc_123_456/chunked/index-dvr.m3u8"
+            ),
+        )
+        # anything following the index file name (e.g. a query string) is dropped too
+        self.assertEqual(
+            "https://example.com/abc/160p30/",
+            Video._extract_base_url(
+                "https://example.com/abc/160p30/index-muted-ABC.m3u8?token=a/b"
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,11 +29,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import argparse
+import logging
 import multiprocessing
-import os
 import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from random import uniform
 from time import sleep
 
 from twitcharchiver.api import Api
@@ -41,7 +43,6 @@ from twitcharchiver.arguments import Arguments
 from twitcharchiver.channel import Channel
 from twitcharchiver.configuration import Configuration
 from twitcharchiver.logger import Logger
-from twitcharchiver.processing import Processing
 from twitcharchiver.utils import (
     getenv,
     check_update_available,
@@ -54,9 +55,12 @@ __version__ = "4.3.0"
 from twitcharchiver.vod import Vod, ArchivedVod
 
 
-def main():
+def _build_parser():
     """
-    Main processing for twitch-archiver.
+    Builds the argument parser for twitch-archiver.
+
+    :return: configured argument parser
+    :rtype: argparse.ArgumentParser
     """
     parser = argparse.ArgumentParser(
         argument_default=None,
@@ -150,7 +154,7 @@ def main():
         help="Directory to store archived VOD(s), use TWO slashes for Windows paths.\n"
         "(default: current directory)",
         type=Path,
-        default=getenv("TWITCH_ARCHIVER_DIRECTORY", Path(os.getcwd())),
+        default=getenv("TWITCH_ARCHIVER_DIRECTORY", Path.cwd()),
     )
     parser.add_argument(
         "-w",
@@ -203,8 +207,7 @@ def main():
         type=Path,
         help="Directory to store configuration and VOD database.\n(default: %(default)s)",
         default=getenv(
-            "TWITCH_ARCHIVER_CONFIG_DIR",
-            Path(os.path.expanduser("~"), ".config", "twitch-archiver"),
+            "TWITCH_ARCHIVER_CONFIG_DIR", Path.home() / ".config" / "twitch-archiver"
         ),
     )
     parser.add_argument(
@@ -241,6 +244,15 @@ def main():
         default=False,
     )
 
+    return parser
+
+
+def main():
+    """
+    Main processing for twitch-archiver.
+    """
+    parser = _build_parser()
+
     # set multiprocessing start mode
     multiprocessing.set_start_method("spawn")
 
@@ -253,67 +265,94 @@ def main():
     log.debug("Debug logging enabled.")
 
     # debug only: output sanitized version of arguments
-    args_sanitized = args.get().copy()
-    for key in ["pushbullet_key"]:
-        if args_sanitized[key]:
-            args_sanitized.update({key: 24 * "*" + args_sanitized[key][24:]})
-
-    log.debug("Arguments: %s", args_sanitized)
-
-    # compare with current git version
-    latest_version, release_notes = get_latest_version()
-    if check_update_available(__version__, latest_version):
-        log.warning(
-            "New version of Twitch-Archiver available - Version %s:\n"
-            "https://github.com/Brisppy/twitch-archiver/releases/latest\nRelease notes:\n\n%s\n",
-            latest_version,
-            release_notes,
-        )
-    else:
-        log.info(
-            "Twitch Archiver v%s - https://github.com/Brisppy/twitch-archiver",
-            __version__,
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        args_sanitized = {**args.get()}
+        for key in ("pushbullet_key", "oauth_token"):
+            if args_sanitized[key]:
+                args_sanitized[key] = 24 * "*" + args_sanitized[key][24:]
+
+        log.debug("Arguments: %s", args_sanitized)
+
+    config_dir = args.get("config_dir")
+
+    # compare with current git version, skipped when quiet as the result wouldn't be shown
+    if not args.get("quiet"):
+        latest_version, release_notes = get_latest_version(
+            Path(config_dir, ".version_check")
         )
+        if check_update_available(__version__, latest_version):
+            log.warning(
+                "New version of Twitch-Archiver available - Version %s:\n"
+                "https://github.com/Brisppy/twitch-archiver/releases/latest\nRelease notes:\n\n%s\n",
+                latest_version,
+                release_notes,
+            )
+        else:
+            log.info(
+                "Twitch Archiver v%s - https://github.com/Brisppy/twitch-archiver",
+                __version__,
+            )
 
     # load configuration from ini
     config = Configuration()
-    config.load_config(Path(args.get("config_dir"), "config.ini"))
-    log.debug("Settings prior to loading config: %s", config.get_sanitized())
+    config.load_config(Path(config_dir, "config.ini"))
+    if debug_enabled:
+        log.debug("Settings prior to loading config: %s", config.get_sanitized())
 
     # overwrite different or missing configuration variables
     config.generate_config(args.get())
-    log.debug("Settings after loading config: %s", config.get_sanitized())
+    if debug_enabled:
+        log.debug("Settings after loading config: %s", config.get_sanitized())
 
     # set OAuth token if provided
-    if config.get("oauth_token"):
+    oauth_token = config.get("oauth_token")
+    if oauth_token:
         _api = Api()
-        _api.oauth_token = config.get("oauth_token")
+        _api.oauth_token = oauth_token
 
     # create temp dir for downloads and lock files
     Path(get_temp_dir()).mkdir(exist_ok=True)
 
+    # imported here as the downloaders aren't needed for --version, --help or --show-config
+    from twitcharchiver.processing import Processing
+
     process = Processing(Configuration.get())
 
-    if args.get("channel") is not None:
-        channels = [Channel(c) for c in args.get("channel")]
+    try:
+        # channel and VOD metadata is retrieved concurrently as each requires several
+        # sequential API calls, downloads themselves are still processed in order.
+        channel_names, vod_ids = args.get("channel"), args.get("vod")
+        if channel_names is not None:
+            with ThreadPoolExecutor(max(1, min(len(channel_names), 8))) as _pool:
+                channels = list(_pool.map(Channel, channel_names))
+
+            watch = args.get("watch")
+            while True:
+                process.get_channel(channels)
 
-        while True:
-            process.get_channel(channels)
+                if watch:
+                    # jitter prevents multiple instances from polling in lockstep
+                    sleep(10 + uniform(-2, 2))
 
-            if args.get("watch"):
-                sleep(10)
+                else:
+                    break
 
-            else:
-                break
+            log.info("Finished archiving channel(s).")
 
-        log.info("Finished archiving channel(s).")
+        elif vod_ids is not None:
+            with ThreadPoolExecutor(max(1, min(len(vod_ids), 8))) as _pool:
+                vods = list(
+                    _pool.map(lambda v: ArchivedVod.convert_from_vod(Vod(v)), vod_ids)
+                )
 
-    elif args.get("vod") is not None:
-        vods = [ArchivedVod.convert_from_vod(Vod(v)) for v in args.get("vod")]
+            process.vod_downloader(vods)
 
-        process.vod_downloader(vods)
+            log.info("Finished archiving VOD(s).")
 
-        log.info("Finished archiving VOD(s).")
+    finally:
+        # commit and optimize the VOD database before exiting
+        process.close()
 
 
 if __name__ == "__main__":
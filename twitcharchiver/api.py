@@ -5,6 +5,8 @@ import logging
 from time import sleep
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from twitcharchiver.exceptions import (
     RequestError,
@@ -14,6 +16,13 @@ from twitcharchiver.exceptions import (
     TwitchAPIErrorBadRequest,
 )
 
+# exceptions raised for unrecoverable status codes, any other non-200 code raises TwitchAPIError
+_STATUS_CODE_ERRORS = {
+    400: TwitchAPIErrorBadRequest,
+    403: TwitchAPIErrorForbidden,
+    404: TwitchAPIErrorNotFound,
+}
+
 
 class Api:
     """
@@ -34,6 +43,23 @@ class Api:
         Class constructor.
         """
         self._session = requests.session()
+        # the api instance is shared between threads (e.g. concurrent chat downloads), so
+        # the connection pool must be large enough for connections to be kept alive.
+        # transient gateway errors are retried on the open connection rather than
+        # surfacing as a TwitchAPIError.
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ),
+        )
         self._headers = {}
         self.oauth_token = ""
         self.logging = logging.getLogger()
@@ -68,15 +94,17 @@ class Api:
 
         :param url: http/s endpoint to send request to
         :param p: parameter(s) to pass with request
-        :param h: header to pass with request (overrides class headers)
+        :param h: header(s) to pass with request, merged with class headers
         :return: entire requests response
         :raises requestError: on requests module error
         :raises TwitchAPIErrorBadRequest: on http code 400
         :raises TwitchAPIErrorForbidden: on http code 403
         :raises TwitchAPIErrorNotFound: on http code 404
-        :raises TwitchAPIError: on any http code other than 400, 403, 404 or 200
+        :raises TwitchAPIError: on any http code other than 400, 403, 404 or 200 (or 304 for conditional requests)
         """
-        _headers = h or self._headers
+        _headers = {**self._headers, **(h or {})}
+        # 304 is only a valid response to a conditional request
+        _ok_codes = (200, 304) if "If-None-Match" in _headers else (200,)
         _params = p
 
         # request retry loop
@@ -87,14 +115,8 @@ class Api:
                 )
 
                 # unrecoverable exceptions
-                if _r.status_code == 400:
-                    raise TwitchAPIErrorBadRequest(_r)
-                if _r.status_code == 403:
-                    raise TwitchAPIErrorForbidden(_r)
-                if _r.status_code == 404:
-                    raise TwitchAPIErrorNotFound(_r)
-                if _r.status_code != 200:
-                    raise TwitchAPIError(_r)
+                if _r.status_code not in _ok_codes:
+                    raise _STATUS_CODE_ERRORS.get(_r.status_code, TwitchAPIError)(_r)
 
                 return _r
 
@@ -142,7 +164,7 @@ class Api:
                     )
 
                 if _r.status_code != 200:
-                    raise TwitchAPIError(_r)
+                    raise _STATUS_CODE_ERRORS.get(_r.status_code, TwitchAPIError)(_r)
 
                 return _r
 
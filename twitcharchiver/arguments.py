@@ -7,12 +7,18 @@ import sys
 
 from pathlib import Path
 
+_VOD_URL_PATTERN = re.compile(r"(?<=twitch\.tv/videos/)\d+")
+_CHANNEL_URL_PATTERN = re.compile(r"(?<=twitch\.tv/)[a-zA-Z0-9_]+")
+
 
 class Arguments:
     """
     Function for parsing arguments for access later.
     """
 
+    # all state is held at the class level, so instances don't need a __dict__
+    __slots__ = ()
+
     __args = {}
     _log = logging.getLogger()
 
@@ -23,8 +29,7 @@ class Arguments:
 
         :param args: arguments object to create parameters from
         """
-        for argument in args:
-            cls.set(argument, args[argument])
+        cls.__args.update(args)
 
         if cls.get("show_config"):
             try:
@@ -67,7 +72,7 @@ class Arguments:
 
         # split quality into [resolution, framerate]
         if cls.get("quality") not in ["best", "worst"]:
-            cls.set("quality", cls.get("quality").split("p"))
+            cls.set("quality", cls.get("quality").split("p", 1))
 
         if cls.get("watch"):
             print("Launching Twitch-Archiver in watch mode.")
@@ -112,29 +117,28 @@ class Arguments:
         if cls.get("file"):
             collected: list = []
             for arg in cls.get(arg_name).split(","):
-                # convert list to Path() variables and store for further processing
-                collected.extend(Arguments.load_file_line_by_line(Path(arg)))
+                # convert list to Path() variables and store for further processing, with each line
+                # able to hold several comma-separated values
+                for line in Arguments.load_file_line_by_line(Path(arg)):
+                    collected.extend(line.split(","))
 
-            cls.set(arg_name, ",".join(collected))
+        else:
+            collected = cls.get(arg_name).split(",")
 
         # format urls to just vod ids or channel names
-        for arg in cls.get(arg_name).split(","):
+        for arg in collected:
             # skip empty args
             if arg == "":
                 continue
 
             # extract VOD ID or channel name if url passed
             if "/videos/" in arg:
-                match = re.findall(r"(?<=twitch\.tv/videos/)[0-9]*", arg)
+                match = _VOD_URL_PATTERN.search(arg)
             else:
-                match = re.findall(r"(?<=twitch\.tv/)[a-zA-Z]*", arg)
+                match = _CHANNEL_URL_PATTERN.search(arg)
 
             # store the extracted value or simply pass to passed args if no match found
-            if match:
-                parsed_args.append(match[0])
-
-            else:
-                parsed_args.append(arg)
+            parsed_args.append(match.group() if match else arg)
 
         cls.set(arg_name, parsed_args)
 
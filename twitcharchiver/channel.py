@@ -12,6 +12,9 @@ from twitcharchiver.api import Api
 from twitcharchiver.exceptions import TwitchAPIError
 from twitcharchiver.utils import time_since_date
 
+# time in seconds after which all pages of a channel's VODs are retrieved again
+VIDEO_LIST_REFRESH_INTERVAL = 3600
+
 
 class Channel:
     """
@@ -38,11 +41,15 @@ class Channel:
 
         self._last_update: float = 0
 
+        # videos retrieved by the last full listing of the channel's VODs
+        self._videos: list = []
+        self._videos_updated: float = 0
+
         if owner:
             self._parse_dict(owner)
 
         elif self.name or self.id:
-            self._parse_dict(self._fetch_metadata())
+            self.refresh_metadata()
 
     def __repr__(self):
         return str(self.get_info())
@@ -83,27 +90,28 @@ class Channel:
         self.display_name = owner["displayName"]
         self.stream = owner["stream"]
 
-    def _fetch_metadata(self):
+    def fetch_metadata(self):
         """
-        Fetches metadata from Twitch regarding the channel.
+        Fetches metadata from Twitch regarding the channel without applying it, so it can be retrieved while the
+        channel is used elsewhere.
 
         :return: retrieved user data
         :rtype dict
         """
-        if self.id and not self.name:
-            self.name = self._user_from_id(self.id)["login"]
+        _name = self.name
+        if self.id and not _name:
+            _name = self._user_from_id(self.id)["login"]
 
         _r = self._api.gql_request(
             "ChannelShell",
             "580ab410bcd0c1ad194224957ae2241e5d252b2c5173d8e0cce9d32d5bb14efe",
-            {"login": f"{self.name}"},
+            {"login": f"{_name}"},
         )
         _user_data = _r.json()[0]["data"]["userOrError"]
-        self._log.debug("User data for %s: %s", self.name, _user_data)
+        self._log.debug("User data for %s: %s", _name, _user_data)
 
         # failure return contains "userDoesNotExist" key
         if "userDoesNotExist" not in _user_data.keys():
-            self._last_update = datetime.now(timezone.utc).timestamp()
             return _user_data
 
         return {}
@@ -137,11 +145,19 @@ class Channel:
             self.refresh_metadata()
         return self.stream is not None
 
-    def refresh_metadata(self):
+    def refresh_metadata(self, metadata: dict = None):
         """
         Refreshes all metadata for the channel.
+
+        :param metadata: user data previously retrieved with fetch_metadata(), fetched if not provided
+        :type metadata: dict
         """
-        self._parse_dict(self._fetch_metadata())
+        if metadata is None:
+            metadata = self.fetch_metadata()
+
+        self._parse_dict(metadata)
+        if metadata:
+            self._last_update = datetime.now(timezone.utc).timestamp()
 
     def get_stream_info(self):
         """Retrieves information relating to a channel if it is currently live.
@@ -340,13 +356,21 @@ class Channel:
 
     def get_channel_videos(self):
         """
-        Retrieves all available VODs for the channel.
+        Retrieves all available VODs for the channel. VODs are returned newest first, so if the channel was listed
+        recently, pagination stops at the first VOD already seen and the older VODs are taken from that listing.
+        VODs deleted since the last full listing may therefore be returned until VIDEO_LIST_REFRESH_INTERVAL has
+        passed, after which every page is retrieved again and the stored listing is replaced.
 
         :return: list of all available VODs for the channel
         :rtype: list[Vod]
         """
         from twitcharchiver.vod import Vod
 
+        # VODs from the previous listing, ignored once it is old enough that VODs may have since been deleted
+        _known_v_ids = set()
+        if time_since_date(self._videos_updated) < VIDEO_LIST_REFRESH_INTERVAL:
+            _known_v_ids = {v.v_id for v in self._videos}
+
         _channel_videos = []
         _query_vars = {
             "broadcastType": "ARCHIVE",
@@ -362,30 +386,38 @@ class Channel:
                 _query_vars,
             )
 
+            # parse response once per page
+            _page = _r.json()[0]["data"]["user"]["videos"]
+
             # retrieve list of videos from response
-            _videos = [
-                Vod(vod_info=v["node"])
-                for v in _r.json()[0]["data"]["user"]["videos"]["edges"]
-            ]
+            _videos = [Vod(vod_info=v["node"]) for v in _page["edges"]]
             _channel_videos.extend(_videos)
 
-            if (
-                _r.json()[0]["data"]["user"]["videos"]["pageInfo"]["hasNextPage"]
-                is not False
-            ):
+            # remaining VODs were retrieved by the previous listing
+            if any(v.v_id in _known_v_ids for v in _videos):
+                _retrieved_v_ids = {v.v_id for v in _channel_videos}
+                _channel_videos.extend(
+                    v for v in self._videos if v.v_id not in _retrieved_v_ids
+                )
+                break
+
+            if _page["pageInfo"]["hasNextPage"] is not False:
                 # set cursor
-                _query_vars["cursor"] = _r.json()[0]["data"]["user"]["videos"]["edges"][
-                    -1
-                ]["cursor"]
+                _query_vars["cursor"] = _page["edges"][-1]["cursor"]
 
             else:
+                # full listing retrieved
+                self._videos_updated = datetime.now(timezone.utc).timestamp()
                 break
 
+        self._videos = _channel_videos
+
         if _channel_videos:
             self._log.debug(
                 "VODs retrieved for %s: %s", self.name, len(_channel_videos)
             )
-            return _channel_videos
+            # return a copy so callers adding to the list (e.g. a stream's VOD) don't alter the stored listing
+            return list(_channel_videos)
 
         self._log.debug("No VODs found for %s.", self.name)
         return []
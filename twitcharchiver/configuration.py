@@ -121,10 +121,10 @@ class Configuration:
         :param name: name of attribute to retrieve value of - 'None' returns all attributes
         :return: requested value(s)
         """
-        configuration = cls.__conf.copy()
-        for key in ["pushbullet_key", "oauth_token"]:
+        configuration = {**cls.__conf}
+        for key in ("pushbullet_key", "oauth_token"):
             if configuration[key]:
-                configuration.update({key: 24 * "*" + configuration[key][24:]})
+                configuration[key] = 24 * "*" + configuration[key][24:]
 
         if name is None:
             return configuration
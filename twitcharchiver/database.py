@@ -4,11 +4,12 @@ Module used for creating, accessing, updating and modifying database entries.
 
 import logging
 import sqlite3
+from contextlib import contextmanager
 from sqlite3 import Error
 
 from twitcharchiver.exceptions import DatabaseError, DatabaseQueryError
 
-__db_version__ = 5
+__db_version__ = 6
 
 
 class Database:
@@ -30,6 +31,10 @@ class Database:
             self.log.debug("Database path: %s", self.database_path)
             self.connection = sqlite3.connect(self.database_path)
             self.cursor = self.connection.cursor()
+            # write-ahead logging allows reads while another connection is writing (e.g. concurrent chat
+            # downloads), in which case a full sync on every commit is unnecessary
+            self.cursor.execute("PRAGMA journal_mode=WAL;")
+            self.cursor.execute("PRAGMA synchronous=NORMAL;")
             self.log.debug("Connection to SQLite DB successful.")
 
         except Error as exc:
@@ -43,33 +48,65 @@ class Database:
         version = self.execute_query("pragma user_version")[0][0]
 
         if version != __db_version__:
-            # incremental database updating based on version number
-            # create the latest db schema if none exists
-            if version == 0:
-                self.log.debug("No schema found, creating database.")
-                [self.execute_query(_query) for _query in create_vods_table]
-
-            # update version 2 schema to version 3
-            if version == 2:
-                self.log.debug(
-                    "Performing incremental DB update. Version 2 -> Version 3."
-                )
-                self.update_database(2)
-                version = 3
-
-            # update version 3 schema to version 4
-            if version == 3:
-                self.log.debug(
-                    "Performing incremental DB update. Version 3 -> Version 4."
-                )
-                self.update_database(3)
-                version = 4
-
-            if version == 4:
-                self.log.debug(
-                    "Performing incremental DB update. Version 3 -> Version 4."
-                )
-                self.update_database(4)
+            # perform all schema changes in a single write transaction so that the database is never left
+            # partially upgraded
+            with self.transaction():
+                # incremental database updating based on version number
+                # create the latest db schema if none exists
+                if version == 0:
+                    self.log.debug("No schema found, creating database.")
+                    [self.execute_query(_query) for _query in create_vods_table]
+
+                # update version 2 schema to version 3
+                if version == 2:
+                    self.log.debug(
+                        "Performing incremental DB update. Version 2 -> Version 3."
+                    )
+                    self.update_database(2)
+                    version = 3
+
+                # update version 3 schema to version 4
+                if version == 3:
+                    self.log.debug(
+                        "Performing incremental DB update. Version 3 -> Version 4."
+                    )
+                    self.update_database(3)
+                    version = 4
+
+                # update version 4 schema to version 5
+                if version == 4:
+                    self.log.debug(
+                        "Performing incremental DB update. Version 4 -> Version 5."
+                    )
+                    self.update_database(4)
+                    version = 5
+
+                # update version 5 schema to version 6
+                if version == 5:
+                    self.log.debug(
+                        "Performing incremental DB update. Version 5 -> Version 6."
+                    )
+                    self.update_database(5)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Runs the enclosed statements within a single write transaction, committing on exit or rolling back if an
+        exception is raised.
+        """
+        # commit anything pending so the write lock can be acquired up front
+        if self.connection.in_transaction:
+            self.connection.commit()
+
+        self.cursor.execute("BEGIN IMMEDIATE;")
+        try:
+            yield self
+
+        except BaseException:
+            self.connection.rollback()
+            raise
+
+        self.connection.commit()
 
     def update_database(self, version):
         """
@@ -80,16 +117,16 @@ class Database:
         self.log.debug("Setting up vods table if it doesn't already exist.")
 
         if version == 2:
-            with Database(self.database_path) as _db:
-                [_db.execute_query(query) for query in version_2_to_3_upgrade]
+            [self.execute_query(query) for query in version_2_to_3_upgrade]
 
         if version == 3:
-            with Database(self.database_path) as _db:
-                [_db.execute_query(query) for query in version_3_to_4_upgrade]
+            [self.execute_query(query) for query in version_3_to_4_upgrade]
 
         if version == 4:
-            with Database(self.database_path) as _db:
-                [_db.execute_query(query) for query in version_4_to_5_upgrade]
+            [self.execute_query(query) for query in version_4_to_5_upgrade]
+
+        if version == 5:
+            [self.execute_query(query) for query in version_5_to_6_upgrade]
 
     # reference:
     #   https://codereview.stackexchange.com/questions/182700/python-class-to-manage-a-table-in-sqlite
@@ -97,20 +134,35 @@ class Database:
         return self
 
     def __exit__(self, ext_type, exc_value, traceback):
-        self.cursor.close()
         if isinstance(exc_value, Exception):
+            self.cursor.close()
             self.connection.rollback()
             self.connection.close()
             raise DatabaseError(exc_value)
 
+        self.close()
+
+    def close(self):
+        """
+        Commits any pending changes, optimizes and closes the database connection.
+        """
+        self.cursor.close()
         self.connection.commit()
+
+        # let sqlite refresh query planner statistics if they have become stale, as recommended before closing
+        try:
+            self.connection.execute("PRAGMA optimize;")
+
+        except Error as exc:
+            self.log.debug("Failed to optimize database. %s", exc)
+
         self.connection.close()
 
     def execute_query(self, command, values=None):
         """Executes a given SQL statement.
 
         :param command: sql query to execute
-        :param values: values to pass if inserting data - 'None' sends no other data
+        :param values: sequence of positional or dict of named placeholder values - 'None' sends no other data
         :return: response from sqlite database to statement
         """
         self.log.debug("Executing SQL statement: %s", command)
@@ -120,7 +172,7 @@ class Database:
                 _r = self.cursor.execute(command).fetchall()
             else:
                 self.log.debug("Values: %s", values)
-                _r = self.cursor.execute(command, list(values.values())).fetchall()
+                _r = self.cursor.execute(command, values).fetchall()
 
         except Exception as exc:
             raise DatabaseQueryError(str(exc)) from exc
@@ -128,6 +180,14 @@ class Database:
         return _r
 
 
+# covering indexes for looking up VODs by channel and by stream
+create_vods_indexes = [
+    """CREATE INDEX IF NOT EXISTS "idx_vods_user_id"
+    ON "vods" ("user_id", "vod_id", "stream_id", "created_at", "chat_archived", "video_archived");""",
+    """CREATE INDEX IF NOT EXISTS "idx_vods_stream_id"
+    ON "vods" ("stream_id", "chat_archived", "video_archived");""",
+]
+
 create_vods_table = [
     """CREATE TABLE "vods" (
         "vod_id"            INTEGER,
@@ -146,8 +206,8 @@ create_vods_table = [
         "video_archived"    BIT,
         PRIMARY KEY("vod_id","stream_id")
     );""",
+    *create_vods_indexes,
     f"PRAGMA user_version = {__db_version__};",
-    "PRAGMA journal_mode=WAL;",
 ]
 
 INSERT_VOD = """
@@ -155,7 +215,18 @@ REPLACE INTO
 vods (vod_id, stream_id, user_id, user_name, chapters, title, description, created_at, published_at, thumbnail_url, 
       duration, muted_segments, chat_archived, video_archived)
 VALUES
-(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+(:vod_id, :stream_id, :user_id, :user_name, :chapters, :title, :description, :created_at, :published_at,
+ :thumbnail_url, :duration, :muted_segments, :chat_archived, :video_archived);
+"""
+
+SELECT_CHANNEL_VODS = """
+SELECT vod_id, stream_id, created_at, chat_archived, video_archived FROM vods
+WHERE user_id = ?;
+"""
+
+SELECT_STREAM_VOD_FORMATS = """
+SELECT chat_archived, video_archived FROM vods
+WHERE stream_id = ?;
 """
 
 # change pk from id to user_id + created_at
@@ -233,7 +304,6 @@ version_3_to_4_upgrade = [
 # add field for VOD chapters
 # remove user_login, url, view_count, viewable, language, type, store_directory fields
 # swapped order of chat and video archive flags
-# enable write-ahead logging
 version_4_to_5_upgrade = [
     "ALTER TABLE vods RENAME TO vods_bak;",
     """CREATE TABLE "vods" (
@@ -257,5 +327,14 @@ version_4_to_5_upgrade = [
     "created_at, published_at, thumbnail_url, duration, muted_segments, video_archived, chat_archived FROM vods_bak;",
     "DROP TABLE vods_bak;",
     "PRAGMA user_version = 5;",
-    "PRAGMA journal_mode=WAL;",
+]
+
+# add covering indexes for channel and stream lookups
+# convert muted segments stored as a python repr (single-quoted keys, True / False) to json
+version_5_to_6_upgrade = [
+    *create_vods_indexes,
+    """UPDATE vods SET muted_segments =
+    REPLACE(REPLACE(REPLACE(muted_segments, '''', '"'), 'True', 'true'), 'False', 'false')
+    WHERE muted_segments LIKE '%''%';""",
+    "PRAGMA user_version = 6;",
 ]
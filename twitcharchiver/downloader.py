@@ -7,7 +7,7 @@ import traceback
 from pathlib import Path
 
 from twitcharchiver.configuration import Configuration
-from twitcharchiver.database import Database, INSERT_VOD
+from twitcharchiver.database import Database, INSERT_VOD, SELECT_STREAM_VOD_FORMATS
 from twitcharchiver.exceptions import VodLockedError
 from twitcharchiver.utils import get_temp_dir
 from twitcharchiver.vod import ArchivedVod, Vod
@@ -75,7 +75,7 @@ class DownloadHandler:
 
         _conf: dict = Configuration.get()
         self._lock_file = None
-        self._config_dir: Path = _conf["config_dir"]
+        self._db_path: Path = Path(_conf["config_dir"], "vods.db")
         self._with_database: bool = bool(_conf["channel"])
         self.vod: ArchivedVod = vod
 
@@ -122,6 +122,16 @@ class DownloadHandler:
             if self._with_database:
                 self.insert_into_database()
 
+    def is_locked(self):
+        """
+        Checks whether a lock file exists for the VOD. This is only a quick check to skip VODs being archived by
+        another instance, locks are still acquired atomically with create_lock.
+
+        :return: True if lock file exists
+        :rtype: bool
+        """
+        return self._lock_fp.exists()
+
     def create_lock(self):
         """
         Creates a lock file for a given VOD.
@@ -156,25 +166,23 @@ class DownloadHandler:
         """
         Inserts (or updates) the VOD in the VOD database.
         """
-        # check if VOD already in database
-        with Database(Path(self._config_dir, "vods.db")) as _db:
-            downloaded_vod = ArchivedVod.import_from_db(
-                _db.execute_query(
-                    "SELECT vod_id,stream_id,created_at,chat_archived,video_archived FROM vods WHERE stream_id IS ?",
-                    {"stream_id": self.vod.s_id},
-                )
+        # gather VOD information first as it may require further requests to Twitch
+        _vod_values = self.vod.ordered_db_dict()
+
+        with Database(self._db_path) as _db:
+            # check if VOD already in database, only the archived formats are needed
+            _archived_formats = _db.execute_query(
+                SELECT_STREAM_VOD_FORMATS, (self.vod.s_id,)
             )
 
-            # if already present update it
-            if downloaded_vod:
-                # set flags for updating
-                self.vod.chat_archived = (
-                    self.vod.chat_archived or downloaded_vod.chat_archived
-                )
-                self.vod.video_archived = (
-                    self.vod.video_archived or downloaded_vod.video_archived
+            # if already present carry over any formats archived previously
+            if _archived_formats:
+                _chat_archived, _video_archived = _archived_formats[0]
+                self.vod.chat_archived = self.vod.chat_archived or bool(_chat_archived)
+                self.vod.video_archived = self.vod.video_archived or bool(
+                    _video_archived
                 )
-                _db.execute_query(INSERT_VOD, self.vod.ordered_db_dict())
+                _vod_values["chat_archived"] = self.vod.chat_archived
+                _vod_values["video_archived"] = self.vod.video_archived
 
-            else:
-                _db.execute_query(INSERT_VOD, self.vod.ordered_db_dict())
+            _db.execute_query(INSERT_VOD, _vod_values)
@@ -1,7 +1,6 @@
 """
 Module used for downloading chat logs for a given Twitch VOD.
 """
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
@@ -21,6 +20,7 @@ from twitcharchiver.utils import (
     build_output_dir_name,
     time_since_date,
     parse_twitch_timestamp,
+    json_loads,
 )
 from twitcharchiver.vod import Vod, ArchivedVod
 
@@ -60,6 +60,8 @@ class Chat(Downloader):
         # store chat log and seen message ids
         self._chat_log: list = []
         self._chat_message_ids: set = set()
+        # number of messages already written to the readable chat log
+        self._readable_exported: int = 0
 
         # load chat from file if a download was attempted previously
         self.load_from_file()
@@ -72,11 +74,9 @@ class Chat(Downloader):
         Loads the chat log stored in the output directory.
         """
         try:
-            with open(
-                Path(self.output_dir, "verbose_chat.json"), "r", encoding="utf8"
-            ) as chat_file:
+            with open(Path(self.output_dir, "verbose_chat.json"), "rb") as chat_file:
                 self._log.debug("Loading chat log from file.")
-                chat_log = json.loads(chat_file.read())
+                chat_log = json_loads(chat_file.read())
 
             # ignore chat logs created with older incompatible schema - see v2.2.1 changes
             if chat_log and "contentOffsetSeconds" not in chat_log[0].keys():
@@ -177,25 +177,20 @@ class Chat(Downloader):
 
         # grab initial chat segment containing cursor
         _initial_segment, _cursor = self._get_chat_segment(offset=offset)
-        self._chat_log.extend(
-            [m for m in _initial_segment if m["id"] not in self._chat_message_ids]
-        )
-        self._chat_message_ids.update([m["id"] for m in _initial_segment])
+        self._add_messages(_initial_segment)
 
         while True:
             if not _cursor:
                 self._log.debug(
-                    f"{len(self._chat_log) - start_len} messages retrieved from Twitch."
+                    "%s messages retrieved from Twitch.",
+                    len(self._chat_log) - start_len,
                 )
                 break
 
             self._log.debug("Fetching chat segments at cursor: %s.", _cursor)
             # grab next chat segment along with cursor for next segment
             _segment, _cursor = self._get_chat_segment(cursor=_cursor)
-            self._chat_log.extend(
-                [m for m in _segment if m["id"] not in self._chat_message_ids]
-            )
-            self._chat_message_ids.update([m["id"] for m in _segment])
+            self._add_messages(_segment)
             # vod duration in seconds is used as the total for progress bar
             # comment offset is used to track what's been done
             # could be done properly if there was a way to get the total number of comments
@@ -204,6 +199,18 @@ class Chat(Downloader):
                     int(_segment[-1]["contentOffsetSeconds"]), self.vod.duration
                 )
 
+    def _add_messages(self, messages: list):
+        """
+        Appends any messages which haven't already been retrieved to the chat log.
+
+        :param messages: list of chat messages
+        :type messages: list[dict]
+        """
+        for _message in messages:
+            if _message["id"] not in self._chat_message_ids:
+                self._chat_message_ids.add(_message["id"])
+                self._chat_log.append(_message)
+
     def _get_chat_segment(self, offset: int = 0, cursor: str = ""):
         """
         Retrieves a chat segment and any subsequent segments from a given offset.
@@ -242,7 +249,10 @@ class Chat(Downloader):
             }
         }
 
-        _r = self._api.post_request("https://gql.twitch.tv/gql", j=_p).json()
+        # parse the raw bytes, skipping the intermediate str decode done by Response.json()
+        _r = json_loads(
+            self._api.post_request("https://gql.twitch.tv/gql", j=_p).content
+        )
         _comments = _r[0]["data"]["video"]["comments"]
 
         # check if next page exists
@@ -309,10 +319,19 @@ class Chat(Downloader):
         """
         Exports a readable and a JSON-formatted chat log to the output directory.
         """
-        write_file_line_by_line(
-            self.generate_readable_chat_log(self._chat_log),
+        # messages are only ever appended to the chat log, so after the first export only new messages need to
+        # be formatted and appended to the readable log
+        if write_file_line_by_line(
+            self.generate_readable_chat_log(self._chat_log[self._readable_exported :]),
             Path(self.output_dir, "readable_chat.txt"),
-        )
+            append=self._readable_exported > 0,
+        ):
+            self._readable_exported = len(self._chat_log)
+
+        # rewrite the whole file on the next export if writing failed
+        else:
+            self._readable_exported = 0
+
         write_json_file(self._chat_log, Path(self.output_dir, "verbose_chat.json"))
 
     def get_message_count(self):
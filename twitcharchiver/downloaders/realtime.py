@@ -1,7 +1,7 @@
 import os
 from multiprocessing import Queue
 from pathlib import Path
-from time import sleep
+from time import time
 
 from twitcharchiver import Configuration
 from twitcharchiver.api import Api
@@ -105,7 +105,12 @@ class RealTime(Downloader):
                 _w.join()
 
         finally:
-            sleep(1)
+            # give any still running workers up to a second to exit, rather than always waiting
+            _deadline = time() + 1
+            for worker in workers:
+                if worker.is_alive():
+                    worker.join(max(0.0, _deadline - time()))
+
             # kill any still running workers
             for worker in workers:
                 if worker.is_alive():
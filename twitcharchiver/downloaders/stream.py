@@ -14,7 +14,7 @@ import requests
 
 from twitcharchiver.channel import Channel
 from twitcharchiver.downloader import Downloader
-from twitcharchiver.downloaders.video import MpegSegment, Merger
+from twitcharchiver.downloaders.video import MpegSegment, Merger, Video
 from twitcharchiver.exceptions import (
     TwitchAPIErrorNotFound,
     UnsupportedStreamPartDuration,
@@ -264,6 +264,9 @@ class Stream(Downloader):
 
         self._unsupported_parts = set()
 
+        # persistent session so stream parts are fetched over a kept-alive connection
+        self._s: requests.Session = requests.session()
+
         # channel-specific vars
         self.channel: Channel = channel
         self.output_dir: Path = None
@@ -430,10 +433,9 @@ class Stream(Downloader):
 
         if self.output_dir.exists():
             # get existing parts to resume counting if archiving halted
-            self._completed_segments = [
-                MpegSegment(int(Path(p).name.removesuffix(".ts")), 10)
-                for p in list(Path(self.output_dir, "parts").glob("*.ts"))
-            ]
+            self._completed_segments = list(
+                Video.get_completed_segments(self.output_dir)
+            )
 
         self._init_download_queue()
 
@@ -606,7 +608,7 @@ class Stream(Downloader):
         # check broadcast VOD and stream have same stream IDs
         if broadcast_vod.s_id == self.vod.s_id:
             # replace stream VOD for later checks
-            self.vod = Vod(broadcast_vod_id)
+            self.vod = broadcast_vod
             return True
 
     def _download_queued_segments(self):
@@ -646,7 +648,7 @@ class Stream(Downloader):
                 # iterate through each part of the segment, downloading them in order
                 for _part in segment.parts:
                     try:
-                        _r = requests.get(_part.url, stream=True, timeout=5)
+                        _r = self._s.get(_part.url, stream=True, timeout=5)
 
                         if _r.status_code != 200:
                             return
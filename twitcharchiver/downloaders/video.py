@@ -1,13 +1,15 @@
 """
 Module used for downloading the video for a given Twitch VOD.
 """
+import io
 import json
 import logging
 import os
 import re
 import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from math import floor
 from pathlib import Path
@@ -16,6 +18,7 @@ from time import sleep
 import m3u8
 import requests
 from requests import adapters
+from urllib3.util.retry import Retry
 
 from twitcharchiver.api import Api
 from twitcharchiver.downloader import Downloader
@@ -45,6 +48,38 @@ from twitcharchiver.vod import Vod, ArchivedVod
 
 # time in seconds between checking for new VOD parts if VOD is currently live and being updated
 CHECK_INTERVAL = 60
+# maximum time in seconds between checks, the interval is doubled up to this while no new parts are found
+MAX_CHECK_INTERVAL = 240
+
+# patterns used when parsing playlists and ffmpeg output
+_TOTAL_SECS_PATTERN = re.compile(r"(?<=#EXT-X-TWITCH-TOTAL-SECS:).*(?=\n)")
+_FFMPEG_TIME_PATTERN = re.compile(r"(?<=time=).*(?= bitrate=)")
+_FFMPEG_DTS_PATTERN = re.compile(r"(?<=dts = ).*(?=\).)")
+
+
+def _create_segment_session():
+    """
+    Creates the session used for downloading VOD segments.
+
+    :return: session with an expanded connection pool
+    :rtype: requests.Session
+    """
+    # expand download https session pool, connection errors and transient server errors are retried by the
+    # adapter with backoff before falling through to the segment retry loop
+    _s = requests.session()
+    _a = requests.adapters.HTTPAdapter(
+        pool_connections=100,
+        pool_maxsize=100,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    _s.mount("https://", _a)
+
+    return _s
 
 
 class Video(Downloader):
@@ -55,6 +90,8 @@ class Video(Downloader):
     # class vars
     _api: Api = Api()
     _quality: str = ""
+    # segment downloads for every VOD share one session so connections to the CDN are kept alive between VODs
+    _s: requests.Session = _create_segment_session()
 
     def __init__(
         self,
@@ -95,16 +132,16 @@ class Video(Downloader):
         )
         self._muted_segments: set[MpegSegment] = set()
 
-        # expand download https session pool
-        self._s: requests.Session = requests.session()
-        _a = requests.adapters.HTTPAdapter(pool_connections=100, pool_maxsize=100)
-        self._s.mount("https://", _a)
-
         # video segment containers and required params
         self._index_url: str = ""
         self._base_url: str = ""
         self._index_playlist: m3u8 = None
         self._prev_index_playlist: m3u8 = None
+        # segments converted from the current playlist, along with their uris
+        self._index_segments: list[MpegSegment] = []
+        self._index_segment_uris: list[str] = []
+        # entity tag of the current playlist, used to skip re-downloading and parsing it if unchanged
+        self._index_etag: str = ""
 
     def export_metadata(self):
         write_json_file(self.vod.to_dict(), Path(self.output_dir, "vod.json"))
@@ -119,10 +156,16 @@ class Video(Downloader):
         :return: set of segments inside directory
         :rtype: set[MpegSegment]
         """
-        return {
-            MpegSegment(int(Path(p).name.removesuffix(".ts")), 10)
-            for p in list(Path(directory, "parts").glob("*.ts"))
-        }
+        try:
+            with os.scandir(Path(directory, "parts")) as _entries:
+                return {
+                    MpegSegment(int(e.name[:-3]), 10)
+                    for e in _entries
+                    if e.name.endswith(".ts")
+                }
+
+        except FileNotFoundError:
+            return set()
 
     def start(self, _q=None):
         """
@@ -151,9 +194,10 @@ class Video(Downloader):
             # download once
             self._download()
 
-            # while VOD live, check for new parts every CHECK_INTERVAL seconds. if no new parts discovered after
-            # CHECK_INTERVAL * VOD_OFFLINE_TIME seconds, or error returned when trying to check VOD status,
-            # stream is assumed to be offline and we break loop.
+            # while VOD live, check for new parts every CHECK_INTERVAL seconds. if no new parts are discovered the
+            # interval is doubled (up to MAX_CHECK_INTERVAL) and reset once parts begin appearing again. if an
+            # error is returned when trying to check VOD status, stream is assumed to be offline and we break loop.
+            _check_interval = CHECK_INTERVAL
             while self.vod.is_live():
                 self._log.debug(
                     "VOD is still live, attempting to download new video segments."
@@ -162,14 +206,20 @@ class Video(Downloader):
 
                 # refresh VOD metadata
                 self.vod.refresh_vod_metadata()
-                self._download()
+                if self._download():
+                    _check_interval = CHECK_INTERVAL
+                else:
+                    _check_interval = min(_check_interval * 2, MAX_CHECK_INTERVAL)
+                    self._log.debug(
+                        "No new VOD parts found, next check in %ss.", _check_interval
+                    )
 
-                # sleep if processing time < CHECK_INTERVAL before fetching new messages
+                # sleep if processing time < check interval before fetching new messages
                 _loop_time = int(
                     datetime.now(timezone.utc).timestamp() - _start_timestamp
                 )
-                if _loop_time < CHECK_INTERVAL:
-                    sleep(CHECK_INTERVAL - _loop_time)
+                if _loop_time < _check_interval:
+                    sleep(_check_interval - _loop_time)
 
             # delay final archive pass if stream just ended
             self.vod.refresh_vod_metadata()
@@ -188,10 +238,7 @@ class Video(Downloader):
                 "HTTP code 403 or 404 encountered, VOD %s was likely deleted.",
                 self.vod.v_id,
             )
-            with open(
-                Path(self.output_dir, ".ignorelength"), "w", encoding="utf8"
-            ) as _:
-                pass
+            Path(self.output_dir, ".ignorelength").touch()
 
             self.vod.status = "offline"
 
@@ -208,26 +255,76 @@ class Video(Downloader):
         Fetch new segments for video (if any).
         """
         self._prev_index_playlist = self._index_playlist
-        _raw_playlist = self.vod.get_index_playlist(self._index_url)
-        self._index_playlist = m3u8.loads(_raw_playlist)
+
+        # conditionally request the playlist if it has been retrieved before
+        _r = self._api.get_request(
+            self._index_url,
+            h={"If-None-Match": self._index_etag} if self._index_etag else None,
+        )
+        if _r.status_code == 304:
+            self._log.debug("VOD playlist unchanged since last refresh.")
+            return
+
+        self._index_etag = _r.headers.get("ETag", "")
+        _raw_playlist = _r.text
+
+        # only parse the playlist if its segments have changed. segments may be muted in place (N.ts becomes
+        # N-muted.ts) so their uris are compared rather than just the number of segments
+        _uris = [
+            _l.strip()
+            for _l in _raw_playlist.splitlines()
+            if _l.strip() and not _l.startswith("#")
+        ]
+        if self._index_playlist is None or _uris != self._index_segment_uris:
+            self._index_playlist = m3u8.loads(_raw_playlist)
+            self._update_index_segments()
+        else:
+            self._log.debug("No new segments found in VOD playlist.")
+
         # update VOD duration
         try:
             self.vod.duration = floor(
-                float(
-                    re.findall(
-                        r"(?<=#EXT-X-TWITCH-TOTAL-SECS:).*(?=\n)", _raw_playlist
-                    )[0]
-                )
+                float(_TOTAL_SECS_PATTERN.search(_raw_playlist).group(0))
             )
         except Exception as exc:
             self._log.error("Failed to update VOD duration. Error: %s", exc)
 
+    def _update_index_segments(self):
+        """
+        Converts the segments of the current playlist, reusing any segment converted from the previous playlist
+        which has the same uri at the same position.
+        """
+        _prev_segments = self._index_segments
+        _prev_uris = self._index_segment_uris
+
+        self._index_segments = []
+        self._index_segment_uris = []
+        for _i, _s in enumerate(self._index_playlist.segments):
+            # segments muted in place (N.ts -> N-muted.ts) have a new uri and so are converted again
+            if _i < len(_prev_uris) and _prev_uris[_i] == _s.uri:
+                self._index_segments.append(_prev_segments[_i])
+            else:
+                self._index_segments.append(
+                    MpegSegment.convert_m3u8_segment(_s, self._base_url)
+                )
+            self._index_segment_uris.append(_s.uri)
+
     def _download(self):
         """
         Begin downloading segments, fetching new segments as they come out (if VOD live) until stream/VOD ends.
+
+        :return: True if new segments were added to the playlist since the previous call
+        :rtype: bool
         """
+        _prev_segment_count = (
+            len(self._index_playlist.segments) if self._index_playlist else 0
+        )
+
         self.refresh_playlist()
-        self.download_m3u8_playlist()
+
+        # the playlist was only just fetched, so only check it again if downloading took some time
+        if not self.download_m3u8_playlist():
+            return len(self._index_playlist.segments) > _prev_segment_count
 
         # refresh mpegts segment playlist
         self.refresh_playlist()
@@ -241,6 +338,8 @@ class Video(Downloader):
             self._log.debug("New VOD parts found.")
             self.download_m3u8_playlist()
 
+        return len(self._index_playlist.segments) > _prev_segment_count
+
     @staticmethod
     def _extract_base_url(index_url: str):
         """
@@ -249,21 +348,19 @@ class Video(Downloader):
         :param index_url: index url used to create base url
         :return: base url for TS segments
         """
-        _m = re.findall(r"(?<=\/)(index.*)", index_url)[0]
-        return index_url.replace(_m, "")
+        return index_url[: index_url.index("/index") + 1]
 
     def download_m3u8_playlist(self):
         """Downloads the video for a specified m3u8 playlist.
 
+        :return: number of segments which were queued for download
+        :rtype: int
         :raises vodPartDownloadError: error returned when downloading vod parts
         """
         _buffer: set[MpegSegment] = set()
 
         # process all segments in playlist
-        for segment in [
-            MpegSegment.convert_m3u8_segment(_s, self._base_url)
-            for _s in self._index_playlist.segments
-        ]:
+        for segment in self._index_segments:
             # add segment to download buffer if it isn't completed
             if segment not in self._completed_segments:
                 _buffer.add(segment)
@@ -272,18 +369,29 @@ class Video(Downloader):
                 self._muted_segments.add(segment)
 
         if _buffer:
-            _worker_pool = ThreadPoolExecutor(max_workers=self.threads)
+            # resolve directories once rather than for every segment
+            _parts_dir = Path(self.output_dir, "parts")
+            _temp_dir = Path(get_temp_dir(), str(self.vod.v_id))
+
+            # don't spawn more workers than there are segments remaining
+            _worker_pool = ThreadPoolExecutor(
+                max_workers=min(self.threads, len(_buffer))
+            )
             download_error = []
             futures = []
             try:
                 # add orders to worker pool
                 for segment in _buffer:
-                    futures.append(_worker_pool.submit(self._get_ts_segment, segment))
+                    futures.append(
+                        _worker_pool.submit(
+                            self._get_ts_segment, segment, _parts_dir, _temp_dir
+                        )
+                    )
 
                 progress = Progress()
 
-                # complete orders in worker pool
-                for future in futures:
+                # complete orders in worker pool as they finish so progress is reported in real time
+                for future in as_completed(futures):
                     if future.exception():
                         # append any returned errors
                         download_error.append(future.exception())
@@ -307,15 +415,22 @@ class Video(Downloader):
             finally:
                 _worker_pool.shutdown(wait=False, cancel_futures=True)
 
-    def _get_ts_segment(self, segment: MpegSegment):
+        return len(_buffer)
+
+    def _get_ts_segment(self, segment: MpegSegment, parts_dir: Path, temp_dir: Path):
         """Retrieves a specific ts file.
 
         :param segment: MPEGTS segment to download
         :type segment: Segment
+        :param parts_dir: directory completed segments are moved to
+        :type parts_dir: Path
+        :param temp_dir: directory segments are downloaded to
+        :type temp_dir: Path
         :return: error on failure
         :rtype: str
         """
-        _segment_path = segment.generate_path(Path(self.output_dir, "parts"))
+        _segment_path = segment.generate_path(parts_dir)
+        _segment_name = _segment_path.stem
         self._log.debug("Downloading segment %s to %s", segment.url, _segment_path)
 
         # don't bother if piece already downloaded
@@ -328,20 +443,17 @@ class Video(Downloader):
         #   files from storage avoiding any downtime downloading
 
         # create temporary file for downloading to
-        with open(
-            Path(
-                get_temp_dir(),
-                str(self.vod.v_id),
-                f"{segment.id}.ts",
-            ),
-            "wb",
-        ) as _tmp_ts_file:
+        with open(Path(temp_dir, f"{segment.id}.ts"), "wb") as _tmp_ts_file:
             for _ in range(6):
                 if _ > 4:
                     raise VideoPartDownloadError(
                         f"Maximum retries for segment {segment.id} reached."
                     )
 
+                # discard anything written by a previous failed attempt
+                _tmp_ts_file.seek(0)
+                _tmp_ts_file.truncate()
+
                 try:
                     _r = self._s.get(segment.url, stream=True, timeout=10)
 
@@ -356,9 +468,7 @@ class Video(Downloader):
                     for _chunk in _r.iter_content(chunk_size=262144):
                         _tmp_ts_file.write(_chunk)
 
-                    self._log.debug(
-                        "Segment %s download completed.", Path(_segment_path).stem
-                    )
+                    self._log.debug("Segment %s download completed.", _segment_name)
                     self._completed_segments.add(segment)
 
                     break
@@ -366,7 +476,7 @@ class Video(Downloader):
                 except requests.exceptions.RequestException as exc:
                     self._log.debug(
                         "Segment %s download failed (Attempt %s). Error: %s)",
-                        Path(_segment_path).stem,
+                        _segment_name,
                         _ + 1,
                         str(exc),
                     )
@@ -377,7 +487,7 @@ class Video(Downloader):
             safe_move(_tmp_ts_file.name, _segment_path)
             self._log.debug(
                 "Segment %s completed and moved to %s.",
-                Path(_segment_path).stem,
+                _segment_name,
                 _segment_path,
             )
 
@@ -401,7 +511,7 @@ class Video(Downloader):
         if not self._index_url:
             raise VideoDownloadError(
                 "Corrupt segments were found while converting VOD and TA was unable to re-download the missing "
-                "segments. Either re-download the VOD if it is still available, or manually convert 'merged.ts' using "
+                "segments. Either re-download the VOD if it is still available, or manually merge the downloaded parts using "
                 f"FFmpeg. Corrupt parts:\n{str(sorted(corruption))}"
             )
 
@@ -410,8 +520,8 @@ class Video(Downloader):
             # convert segment number to segment file
             segment_fp = str(f"{segment.id:05d}" + ".ts")
 
-            # rename part
-            shutil.move(
+            # rename part, both paths are in the same directory so this is a single rename
+            os.replace(
                 Path(self.output_dir, "parts", segment_fp),
                 Path(self.output_dir, "parts", segment_fp + ".corrupt"),
             )
@@ -457,7 +567,7 @@ class Video(Downloader):
                         segment.id,
                     )
                     self._completed_segments.add(segment)
-                    shutil.move(
+                    os.replace(
                         Path(self.output_dir, "parts", segment_fp + ".corrupt"),
                         Path(self.output_dir, "parts", segment_fp),
                     )
@@ -546,7 +656,7 @@ class Merger:
         self.vod = vod
         self._output_dir = output_dir
         self._completed_segments = completed_segments
-        self._completed_parts = self.get_completed_parts()
+        self._completed_parts: list[str] = []
         self._muted_segment_ids = [s.id for s in muted_segments]
         self._ignore_corrupt_parts = ignore_corrupt_parts
         self._quiet = quiet
@@ -561,23 +671,43 @@ class Merger:
         :raises CorruptPartError: when corruptions are found outside muted segments
         :raises VodConvertError: unrecoverable error ocurred when trying to convert VOD
         """
+        # sort parts once for merging and converting, as segments may have been re-downloaded since the last merge
+        self._completed_parts = self.get_completed_parts()
+
         # export vod chapters
         self._write_chapters()
 
-        # export vod thumbnail
+        # export vod thumbnail, downloading it in the background while the VOD is merged
+        _thumbnail_worker = None
         if self.vod.thumbnail_url:
             if (
                 self.vod.thumbnail_url
                 != "https://vod-secure.twitch.tv/_404/404_processing_90x60.png"
             ):
-                self._write_thumbnail()
+                _thumbnail_worker = threading.Thread(
+                    target=self._write_thumbnail, daemon=True
+                )
+                _thumbnail_worker.start()
 
-        # merge and remux mpegts segments to single mp4
-        self._log.info("Merging VOD parts. This may take a while.")
-        self._combine_vod_parts()
+        try:
+            # parts are streamed straight into ffmpeg if all are present, avoiding writing a merged copy of the
+            # VOD to disk. otherwise they are merged first as missing segments can cause corruption
+            if self._get_discontinuity():
+                self._log.info("Merging VOD parts. This may take a while.")
+                self._combine_vod_parts()
 
-        self._log.info("Converting VOD to mp4. This may take a while.")
-        self._convert_vod()
+                self._log.info("Converting VOD to mp4. This may take a while.")
+                self._convert_vod()
+
+            else:
+                self._log.info(
+                    "Merging and converting VOD to mp4. This may take a while."
+                )
+                self._convert_vod(from_parts=True)
+
+        finally:
+            if _thumbnail_worker:
+                _thumbnail_worker.join()
 
     def _write_chapters(self):
         # retrieve vod chapters
@@ -599,93 +729,78 @@ class Merger:
                 "Failed to retrieve or insert chapters into VOD file. %s", exc
             )
 
+    def _get_discontinuity(self):
+        """
+        Finds any segments missing between the first segment and the final downloaded segment.
+
+        :return: set of missing segment IDs
+        :rtype: set[int]
+        """
+        _completed_ids = {_s.id for _s in self._completed_segments}
+
+        return set(range(max(_completed_ids) + 1)).difference(_completed_ids)
+
     def _combine_vod_parts(self):
         """
-        Combines the downloaded VOD .ts parts.
+        Combines the downloaded VOD .ts parts with the ffmpeg concat demuxer.
         """
         _progress = Progress()
 
-        # concat files if all pieces present, otherwise fall back to using ffmpeg
-        _final_part_id = max([_s.id for _s in self._completed_segments])
-
-        _dicontinuity = set([i for i in range(_final_part_id + 1)]).difference(
-            [_s.id for _s in self._completed_segments]
+        self._log.debug(
+            "Discontinuity found, merging with ffmpeg.\n Discontinuity: %s",
+            self._get_discontinuity(),
         )
-        if not _dicontinuity:
-            # merge all .ts files by concatenating them
-            with open(str(Path(self._output_dir, "merged.ts")), "wb") as _merged_file:
-                _pt = 0
-                for _part in self._completed_parts:
-                    _pt += 1
-                    # append part to merged file
-                    with open(Path(self._output_dir, "parts", _part), "rb") as _ts_part:
-                        shutil.copyfileobj(_ts_part, _merged_file)
-
-                    if not self._quiet:
-                        _progress.print_progress(_pt, len(self._completed_segments))
 
-        else:
-            # merge all .ts files with ffmpeg concat demuxer as missing segments can cause corruption with
-            # other method
+        # create file with list of parts for ffmpeg
+        with open(
+            Path(self._output_dir, "parts", "segments.txt"), "w", encoding="utf8"
+        ) as _segment_file:
+            for _part in self._completed_parts:
+                _segment_file.write(
+                    f"file '{Path(self._output_dir, 'parts', _part)}'\n"
+                )
 
-            self._log.debug(
-                "Discontinuity found, merging with ffmpeg.\n Discontinuity: %s",
-                _dicontinuity,
-            )
+        _command = (
+            f"ffmpeg -hide_banner -fflags +genpts -f concat -safe 0 -y -i "
+            f'"{str(Path(self._output_dir, "parts", "segments.txt"))}" '
+            f'-c copy "{str(Path(self._output_dir, "merged.ts"))}"'
+        )
 
-            # create file with list of parts for ffmpeg
-            with open(
-                Path(self._output_dir, "parts", "segments.txt"), "w", encoding="utf8"
-            ) as _segment_file:
-                for _part in self._completed_parts:
-                    _segment_file.write(
-                        f"file '{Path(self._output_dir, 'parts', _part)}'\n"
-                    )
+        self._log.debug("FFmpeg Command: %s", _command)
 
-            _command = (
-                f"ffmpeg -hide_banner -fflags +genpts -f concat -safe 0 -y -i "
-                f'"{str(Path(self._output_dir, "parts", "segments.txt"))}" '
-                f'-c copy "{str(Path(self._output_dir, "merged.ts"))}"'
-            )
+        with subprocess.Popen(
+            sanitize_command(_command),
+            shell=True,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            encoding="cp437",
+        ) as _p:
+            # get progress from ffmpeg output and print progress bar
+            if not self._quiet:
+                for _line in _p.stderr:
+                    if "time=" in _line.rstrip():
+                        # extract current timestamp from output
+                        _cur_time = (
+                            _FFMPEG_TIME_PATTERN.search(_line).group(0).split(":")
+                        )
+                        _cur_time = (
+                            int(_cur_time[0]) * 3600
+                            + int(_cur_time[1]) * 60
+                            + int(_cur_time[2][:2])
+                        )
 
-            self._log.debug("FFmpeg Command: %s", _command)
+                        _progress.print_progress(int(_cur_time), self.vod.duration)
 
-            with subprocess.Popen(
-                sanitize_command(_command),
-                shell=True,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                encoding="cp437",
-            ) as _p:
-                # get progress from ffmpeg output and print progress bar
-                if not self._quiet:
-                    for _line in _p.stderr:
-                        if "time=" in _line.rstrip():
-                            # extract current timestamp from output
-                            _cur_time = (
-                                re.search("(?<=time=).*(?= bitrate=)", _line)
-                                .group(0)
-                                .split(":")
-                            )
-                            _cur_time = (
-                                int(_cur_time[0]) * 3600
-                                + int(_cur_time[1]) * 60
-                                + int(_cur_time[2][:2])
-                            )
-
-                            _progress.print_progress(int(_cur_time), self.vod.duration)
-
-                if _p.returncode:
-                    self._log.error(
-                        "VOD merger exited with error. Command: %s.", _p.args
-                    )
-                    raise VideoConvertError(
-                        f"VOD merger exited with error. Command: {_p.args}."
-                    )
+            if _p.returncode:
+                self._log.error("VOD merger exited with error. Command: %s.", _p.args)
+                raise VideoConvertError(
+                    f"VOD merger exited with error. Command: {_p.args}."
+                )
 
-    def _convert_vod(self):
+    def _convert_vod(self, from_parts: bool = False):
         """Converts the VOD from a .ts format to .mp4.
 
+        :param from_parts: True to stream the downloaded parts into ffmpeg rather than reading the merged .ts file
         :raises vodConvertError: error encountered during conversion process
         """
         _progress = Progress()
@@ -695,9 +810,12 @@ class Merger:
         _dts_offset = self._get_dts_offset()
 
         # create ffmpeg command
-        _ffmpeg_cmd = (
-            f'ffmpeg -hide_banner -y -i "{Path(self._output_dir, "merged.ts")}" '
-        )
+        if from_parts:
+            _ffmpeg_cmd = "ffmpeg -hide_banner -y -f mpegts -i pipe:0 "
+        else:
+            _ffmpeg_cmd = (
+                f'ffmpeg -hide_banner -y -i "{Path(self._output_dir, "merged.ts")}" '
+            )
         # insert metadata if present
         if Path(self._output_dir, "parts", "chapters.txt").exists():
             _ffmpeg_cmd += f'-i "{Path(self._output_dir, "parts", "chapters.txt")}" -map_metadata 1 '
@@ -707,24 +825,24 @@ class Merger:
         self._log.debug("FFmpeg Command: %s", _ffmpeg_cmd)
 
         # convert merged .ts file to .mp4
-        with subprocess.Popen(
+        with ThreadPoolExecutor(max_workers=1) as _writer_pool, subprocess.Popen(
             sanitize_command(_ffmpeg_cmd),
             shell=True,
+            stdin=subprocess.PIPE if from_parts else None,
             stderr=subprocess.PIPE,
-            universal_newlines=True,
-            encoding="cp437",
         ) as _p:
+            # feed parts to ffmpeg from a separate thread so its output can be read as it is converting
+            _writer = None
+            if from_parts:
+                _writer = _writer_pool.submit(self._write_parts_to_pipe, _p.stdin)
+
             # get progress from ffmpeg output and catch corrupt segments
             _ffmpeg_log = ""
-            for line in _p.stderr:
+            for line in io.TextIOWrapper(_p.stderr, encoding="cp437"):
                 _ffmpeg_log += line.rstrip()
                 if "time=" in line:
                     # extract current timestamp from output
-                    _cur_time = (
-                        re.search(r"(?<=time=).*(?= bitrate=)", line)
-                        .group(0)
-                        .split(":")
-                    )
+                    _cur_time = _FFMPEG_TIME_PATTERN.search(line).group(0).split(":")
                     _cur_time = (
                         int(_cur_time[0]) * 3600
                         + int(_cur_time[1]) * 60
@@ -736,9 +854,7 @@ class Merger:
 
                 elif "Packet corrupt" in line and not self._ignore_corrupt_parts:
                     try:
-                        _dts_timestamp = int(
-                            re.search(r"(?<=dts = ).*(?=\).)", line).group(0)
-                        )
+                        _dts_timestamp = int(_FFMPEG_DTS_PATTERN.search(line).group(0))
 
                     # Catch corrupt parts without timestamp, shows up as 'NOPTS'
                     except ValueError as exc:
@@ -791,6 +907,10 @@ class Merger:
                             "Corrupt packet encountered. Part: %s", _corrupt_part
                         )
 
+            # raise any error encountered while reading parts
+            if _writer:
+                _writer.result()
+
         if _p.returncode:
             self._log.error(
                 "FFmpeg exited with error code, output dumped to VOD directory."
@@ -808,13 +928,34 @@ class Merger:
             # raise error so we can try to recover
             raise CorruptPartError(_corrupt_parts)
 
+    def _write_parts_to_pipe(self, pipe):
+        """
+        Writes the downloaded parts in order to the provided pipe, closing it once all parts have been written.
+
+        :param pipe: binary stdin of the ffmpeg process
+        """
+        try:
+            for _part in self._completed_parts:
+                with open(Path(self._output_dir, "parts", _part), "rb") as _ts_part:
+                    shutil.copyfileobj(_ts_part, pipe, 1024 * 1024)
+
+        # ffmpeg exited before reading all parts, which is handled using its return code
+        except (BrokenPipeError, ValueError) as exc:
+            self._log.debug("FFmpeg stopped reading VOD parts. %s", exc)
+
+        finally:
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
     def _get_dts_offset(self):
         """
         Finds the DTS offset for a given stream based on the lowest available part.
         """
 
-        # fetch parts from dir
-        _parts = self.get_completed_parts()
+        # use the parts sorted at the start of the current merge
+        _parts = self._completed_parts
 
         if _parts:
             # fetch id of first part
@@ -916,12 +1057,12 @@ class Merger:
         """
         Generates a list of segments based on the completed IDs.
 
-        :return: list of segments padded to 5 digits with .ts extension
+        :return: list of segments padded to 5 digits with .ts extension, in segment order
         """
-        return [f"{seg.id:05d}.ts" for seg in self._completed_segments]
+        return [f"{seg.id:05d}.ts" for seg in sorted(self._completed_segments)]
 
     def cleanup_temp_files(self):
         """
         Deletes temporary and transitional files used for archiving VOD video.
         """
-        Path(self._output_dir, "merged.ts").unlink()
+        Path(self._output_dir, "merged.ts").unlink(missing_ok=True)
@@ -20,10 +20,12 @@ class TwitchArchiverError(Exception):
 
     def __init__(self, msg=None, *args, **kwargs):
         self.__dict__.update(kwargs)
-        super().__init__(msg or (self.__doc__, *args))
+        super().__init__(msg or self.__doc__, *args)
 
 
 class RequestError(TwitchArchiverError):
+    """Error occurred while sending API request."""
+
     def __init__(self, url=None, exception=None):
         """
         :param url: url which returned an error
@@ -39,16 +41,40 @@ class RequestError(TwitchArchiverError):
 
 
 class TwitchAPIError(TwitchArchiverError):
+    """Twitch API returned an error."""
+
     def __init__(self, response=None):
         """
         :param response: request object
         :type response: requests.Response
         """
-        message = ""
-        if response:
-            message = f"Twitch API returned status code {response.status_code}. URL: {response.url}, Response: {response.text}"
+        self.response = response
+        self.status_code = None if response is None else response.status_code
+        self.url = None if response is None else response.url
+
+        super().__init__()
+
+    def __str__(self):
+        # the response body is only decoded if the error is actually displayed, as many
+        # errors (such as a 404 at the end of a stream) are caught and discarded
+        if self.response is not None:
+            return (
+                f"Twitch API returned status code {self.status_code}. "
+                f"URL: {self.url}, Response: {self.text}"
+            )
 
-        super().__init__(message)
+        return super().__str__()
+
+    @property
+    def text(self):
+        """
+        :return: body of the response which caused the error
+        :rtype: str
+        """
+        if self.response is None:
+            return ""
+
+        return self.response.text
 
 
 class TwitchAPIErrorForbidden(TwitchAPIError):
@@ -158,17 +184,19 @@ class CorruptPartError(VideoConvertError):
 
 class UnhandledDownloadError(TwitchArchiverError):
     def __init__(self, vod):
+        # the channel is only included if already retrieved, as retrieving it may require an API request
+        _by = f" by {vod._channel.name}" if vod._channel.name else ""
         # handle unsynced stream download (no vod id)
         if vod.v_id == 0:
             message = (
-                f"An unhandled exception occurred while downloading stream {vod.s_id} by {vod.channel.name}. "
+                f"An unhandled exception occurred while downloading stream {vod.s_id}{_by}. "
                 f"Check stream downloaded correctly and remove lock file "
                 f"({Path(get_temp_dir(), f'.lock.{vod.s_id}-stream-only')})."
             )
 
         else:
             message = (
-                f"An unhandled exception occurred while downloading VOD {vod.v_id} by {vod.channel.name}. "
+                f"An unhandled exception occurred while downloading VOD {vod.v_id}{_by}. "
                 f"Check stream downloaded correctly and remove lock file "
                 f"({Path(get_temp_dir(), f'.lock.{vod.s_id}')})."
             )
@@ -229,15 +257,17 @@ class VodAlreadyCompleted(TwitchArchiverError):
 
 class VodUnlockingError(TwitchArchiverError):
     def __init__(self, vod):
+        # the channel is only included if already retrieved, as retrieving it may require an API request
+        _by = f" by {vod._channel.name}" if vod._channel.name else ""
         if vod.v_id:
             message = (
-                f"Failed to remove lock file for stream {vod.v_id} by {vod.channel.name}. Check stream "
-                f"downloaded correctly and remove '.lock.{vod.v_id}' file from config directory."
+                f"Failed to remove lock file for VOD {vod.v_id}{_by}. Check VOD downloaded correctly and "
+                f"remove '.lock.{vod.v_id}' file from config directory."
             )
         else:
             message = (
-                f"Failed to remove lock file for stream {vod.v_id} by {vod.channel.name}. Check stream "
-                f"downloaded correctly and remove '.lock.{vod.s_id}-stream' file from config directory."
+                f"Failed to remove lock file for stream {vod.s_id}{_by}. Check stream downloaded correctly and "
+                f"remove '.lock.{vod.s_id}-stream' file from config directory."
             )
 
         super().__init__(message)
@@ -245,9 +275,13 @@ class VodUnlockingError(TwitchArchiverError):
 
 class VodLockedError(TwitchArchiverError):
     def __init__(self, vod):
+        # locked VODs are skipped silently, so the channel is only included if already retrieved
+        _by = f" by {vod._channel.name}" if vod._channel.name else ""
         if vod.v_id:
-            message = f"Lock file (.lock.{vod.v_id}) already present for VOD {vod.v_id} by {vod.channel.name}."
+            message = (
+                f"Lock file (.lock.{vod.v_id}) already present for VOD {vod.v_id}{_by}."
+            )
         else:
-            message = f"Lock file (.lock.{vod.s_id}-stream) already present for stream {vod.v_id} by {vod.channel.name}."
+            message = f"Lock file (.lock.{vod.s_id}-stream) already present for stream {vod.s_id}{_by}."
 
         super().__init__(message)
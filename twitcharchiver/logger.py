@@ -4,9 +4,11 @@
 """
 Logging class used by Twitch Archiver.
 """
+import atexit
 import logging
 import logging.handlers
 import multiprocessing
+import queue
 import sys
 import traceback
 from pathlib import Path
@@ -25,6 +27,10 @@ class Logger:
     Sets up logging for the script.
     """
 
+    # records are passed to the file handler by a listener thread so that logging calls don't block on file I/O.
+    # console output is still handled synchronously so it stays in order with progress output printed directly
+    _listener: logging.handlers.QueueListener = None
+
     @staticmethod
     def setup_logger(quiet: bool = False, debug: bool = False, logging_dir: str = ""):
         """Sets up logging module.
@@ -80,10 +86,49 @@ class Logger:
         )
         file.setLevel(logging.DEBUG)
         file.setFormatter(FILE_FORMATTER)
-        logger.addHandler(file)
+
+        # the listener's handlers can't be changed while it is running, so it is stopped (flushing any queued
+        # records) and restarted with the new file handler if already running
+        if Logger._listener is not None:
+            _listener = Logger._listener
+            Logger.stop_listener()
+            Logger._listener = logging.handlers.QueueListener(
+                _listener.queue, *_listener.handlers, file, respect_handler_level=True
+            )
+            Logger._listener.start()
+        else:
+            Logger.start_listener(logger, file)
 
         return logger
 
+    @staticmethod
+    def start_listener(logger, *handlers):
+        """
+        Attaches a queue to the given logger and starts a listener thread which passes queued records to the
+        provided handlers.
+
+        :param logger: logging object to attach queue handler to
+        :param handlers: handlers which records are output to
+        """
+        _queue = queue.Queue(-1)
+        Logger._listener = logging.handlers.QueueListener(
+            _queue, *handlers, respect_handler_level=True
+        )
+        Logger._listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(_queue))
+
+        # flush any remaining records on exit
+        atexit.register(Logger.stop_listener)
+
+    @staticmethod
+    def stop_listener():
+        """
+        Stops the listener thread once all queued records have been handled.
+        """
+        if Logger._listener is not None:
+            Logger._listener.stop()
+            Logger._listener = None
+
     @staticmethod
     def setup_debugging(logger):
         logger.setLevel(logging.DEBUG)
@@ -153,6 +198,9 @@ class ProcessLogger(multiprocessing.Process):
                 print("Multiprocess logger error:", file=sys.stderr)
                 traceback.print_exc(file=sys.stderr)
 
+        # exit handlers aren't run for child processes, so the listener is stopped here
+        Logger.stop_listener()
+
 
 def configure_new_process(log_process_queue):
     h = logging.handlers.QueueHandler(log_process_queue)
@@ -6,11 +6,11 @@ import logging
 import shutil
 import signal
 import sys
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from twitcharchiver.channel import Channel
-from twitcharchiver.database import Database
+from twitcharchiver.database import Database, SELECT_CHANNEL_VODS
 from twitcharchiver.downloader import DownloadHandler
 from twitcharchiver.downloaders.chat import Chat
 from twitcharchiver.downloaders.realtime import RealTime
@@ -56,13 +56,23 @@ class Processing:
         # debug flags
         self.force_no_archive: bool = conf["force_no_archive"]
 
-        # perform database setup
-        with Database(Path(self.config_dir, "vods.db")) as _db:
-            _db.setup()
+        # perform database setup, the connection is kept open for reading downloaded VODs as channels may be
+        # checked every few seconds when watching
+        self._db = Database(Path(self.config_dir, "vods.db"))
+        self._db.setup()
+        # downloaded VODs for each channel, valid until the database's data version changes
+        self._downloaded_vods: dict[int, dict[int, ArchivedVod]] = {}
+        self._db_data_version: int = 0
 
         # create signal handler for graceful removal of lock files
         signal.signal(signal.SIGTERM, signal.default_int_handler)
 
+    def close(self):
+        """
+        Closes the VOD database connection kept open by the processor.
+        """
+        self._db.close()
+
     def get_channel(self, channels: list[Channel]):
         """
         Download all vods from a specified channel or list of channels.
@@ -75,17 +85,24 @@ class Processing:
             # set output directory to subdir of channel name
             self.output_dir = Path(self._parent_dir, channel.name)
 
-            # retrieve available vods and extract required info
-            # only need the most recent VOD if running in live-only mode
-            channel_videos: list[Vod] = []
-            if self.live_only:
-                _latest_video: Vod = channel.get_latest_video()
-                if _latest_video:
-                    channel_videos.append(_latest_video)
-            else:
-                channel_videos: list[Vod] = channel.get_channel_videos()
+            # check if the channel is live while its videos are retrieved as they are independent requests. the
+            # worker only fetches the channel's metadata, which is applied to the channel once both have completed
+            with ThreadPoolExecutor(max_workers=1) as _worker_pool:
+                _channel_metadata = _worker_pool.submit(channel.fetch_metadata)
+
+                # retrieve available vods and extract required info
+                # only need the most recent VOD if running in live-only mode
+                channel_videos: list[Vod] = []
+                if self.live_only:
+                    _latest_video: Vod = channel.get_latest_video()
+                    if _latest_video:
+                        channel_videos.append(_latest_video)
+                else:
+                    channel_videos: list[Vod] = channel.get_channel_videos()
 
-            channel_live = channel.is_live(force_refresh=True)
+                channel.refresh_metadata(_channel_metadata.result())
+
+            channel_live = channel.is_live()
             if channel_live:
                 # fetch current stream info
                 stream: Stream = Stream(
@@ -132,8 +149,8 @@ class Processing:
                         stream.cleanup_temp_files()
                         shutil.rmtree(Path(stream.output_dir), ignore_errors=True)
 
-                        if stream.vod.v_id not in [v.v_id for v in channel_videos]:
-                            channel_videos.insert(0, Vod(stream.vod.v_id))
+                        if not any(v.v_id == stream.vod.v_id for v in channel_videos):
+                            channel_videos.insert(0, stream.vod)
 
                     # no paired VOD exists, so we archive the stream before moving onto VODs
                     elif self.archive_video and not self.archive_only:
@@ -156,17 +173,8 @@ class Processing:
             )
 
             # retrieve downloaded vods
-            with Database(Path(self.config_dir, "vods.db")) as _db:
-                # dict containing stream_id: (vod_id, video_downloaded, chat_downloaded)
-                downloaded_vods: list[ArchivedVod] = [
-                    ArchivedVod.import_from_db(v)
-                    for v in _db.execute_query(
-                        "SELECT vod_id,stream_id,created_at,chat_archived,video_archived FROM vods "
-                        "WHERE user_id IS ?",
-                        {"user_id": channel.id},
-                    )
-                ]
-            self.log.debug("Downloaded VODs: %s", len(downloaded_vods))
+            downloaded_vods_by_id = self._get_downloaded_vods(channel)
+            self.log.debug("Downloaded VODs: %s", len(downloaded_vods_by_id))
 
             # generate vod queue using downloaded and available vods
             download_queue: list[ArchivedVod] = []
@@ -175,18 +183,16 @@ class Processing:
                 # insert channel data
                 _vod.channel = channel
 
+                # get downloaded VOD from downloaded VODs (if any)
+                _downloaded_vod = downloaded_vods_by_id.get(_vod.v_id)
+
                 # add any vods not already archived
-                if _vod.v_id not in [v.v_id for v in downloaded_vods]:
+                if _downloaded_vod is None:
                     self.log.debug("VOD added to download queue.")
                     download_queue.append(ArchivedVod.convert_from_vod(_vod))
 
                 # if VOD already downloaded, add it to the queue if formats are missing
                 else:
-                    # get downloaded VOD from list of downloaded VODs
-                    _downloaded_vod = downloaded_vods[
-                        [v.v_id for v in downloaded_vods].index(_vod.v_id)
-                    ]
-
                     # check if any requested format is missing
                     if (
                         not _downloaded_vod.chat_archived
@@ -215,6 +221,32 @@ class Processing:
             else:
                 self.vod_downloader(download_queue)
 
+    def _get_downloaded_vods(self, channel: Channel):
+        """
+        Retrieves the VODs archived for a given channel from the database. Results are reused until another
+        connection modifies the database, as channels may be checked every few seconds when watching.
+
+        :param channel: channel to retrieve downloaded VODs for
+        :return: dict of downloaded VODs keyed by VOD ID
+        :rtype: dict[int, ArchivedVod]
+        """
+        # data_version changes whenever another connection commits to the database
+        _data_version = self._db.execute_query("PRAGMA data_version")[0][0]
+        if _data_version != self._db_data_version:
+            self._db_data_version = _data_version
+            self._downloaded_vods.clear()
+
+        if channel.id not in self._downloaded_vods:
+            # index downloaded VODs by VOD ID, keeping the first entry for any duplicate ID
+            _downloaded_vods: dict[int, ArchivedVod] = {}
+            for _v in self._db.execute_query(SELECT_CHANNEL_VODS, (channel.id,)):
+                _downloaded_vod = ArchivedVod.import_from_db(_v)
+                _downloaded_vods.setdefault(_downloaded_vod.v_id, _downloaded_vod)
+
+            self._downloaded_vods[channel.id] = _downloaded_vods
+
+        return self._downloaded_vods[channel.id]
+
     def vod_downloader(self, download_queue: list[ArchivedVod]):
         """
         Downloads a given list of VODs according to the settings stored inside the class.
@@ -229,6 +261,7 @@ class Processing:
 
         # cache channels with associated broadcast VOD IDs
         _channel_cache: list[Channel] = []
+        _broadcast_v_ids: dict[int, int] = {}
 
         # begin processing each available vod
         for _vod in download_queue:
@@ -251,11 +284,23 @@ class Processing:
                 self.log.debug("Skipping as VOD is offline and `live-only` flag set.")
                 continue
 
+            # skip VODs being archived by another instance before creating downloaders, as they load any
+            # previously downloaded parts and chat logs from disk
+            if DownloadHandler(_vod).is_locked():
+                self.log.debug("Skipping as VOD is locked by another instance.")
+                continue
+
             _channel_index = _channel_cache.index(_vod.channel)
             # if channel is live
             if _channel_cache[_channel_index].is_live():
+                # broadcast VOD ID is only fetched once per channel rather than for every queued VOD
+                if _vod.channel.id not in _broadcast_v_ids:
+                    _broadcast_v_ids[_vod.channel.id] = _channel_cache[
+                        _channel_index
+                    ].get_broadcast_v_id()
+
                 # check if current VOD ID matches associated broadcast VOD ID
-                if _channel_cache[_channel_index].get_broadcast_v_id() == _vod.v_id:
+                if _broadcast_v_ids[_vod.channel.id] == _vod.v_id:
                     # skip if we aren't after currently live streams
                     if self.archive_only:
                         self.log.info(
@@ -290,10 +335,11 @@ class Processing:
             self._start_download(_downloader)
 
         if _chat_download_queue:
-            _worker_pool = ThreadPoolExecutor(max_workers=self.threads)
+            _threads = min(self.threads, len(_chat_download_queue))
+            _worker_pool = ThreadPoolExecutor(max_workers=_threads)
             try:
                 self.log.debug(
-                    "Beginning bulk chat archival with %s threads.", self.threads
+                    "Beginning bulk chat archival with %s threads.", _threads
                 )
                 # create threadpool for chat downloads
                 futures = []
@@ -302,7 +348,7 @@ class Processing:
                         _worker_pool.submit(self._start_download, _downloader)
                     )
 
-                for future in futures:
+                for future in as_completed(futures):
                     if future.exception():
                         self.log.debug(
                             "Exception occurred in chat download pool: %s",
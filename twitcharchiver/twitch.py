@@ -6,6 +6,9 @@ from pathlib import Path
 
 import m3u8
 
+# matches the extension and any suffix (e.g. '-muted') of a segment's file name
+_SEGMENT_SUFFIX_PATTERN = re.compile(r".ts|-[a-zA-Z]*.ts")
+
 
 class Category:
     """
@@ -25,20 +28,10 @@ class Category:
         self.id: int = game["id"]
         self.name: str = game["name"]
 
-        self.slug: str = ""
-        self.thumbnail_url: str = ""
-        self.display_name: str = ""
-        self.type: str = ""
-
-        for _k in game.keys():
-            if _k == "slug":
-                self.slug = game[_k]
-            if _k == "boxArtURL":
-                self.thumbnail_url = game[_k]
-            if _k == "displayName":
-                self.display_name = game[_k]
-            if _k == "type":
-                self.type = game[_k]
+        self.slug: str = game.get("slug", "")
+        self.thumbnail_url: str = game.get("boxArtURL", "")
+        self.display_name: str = game.get("displayName", "")
+        self.type: str = game.get("type", "")
 
     def __repr__(self):
         """
@@ -289,11 +282,20 @@ class MpegSegment(Segment):
         super().__init__(self.id * 10, duration)
 
     def __repr__(self):
-        return str({"id": self.id, "duration": self.duration, "muted": self.muted})
+        return str(self.to_dict())
 
     def __hash__(self):
         return hash(self.id)
 
+    def to_dict(self):
+        """
+        Returns the segment's identifying values.
+
+        :return: dict of segment id, duration and muted status
+        :rtype: dict
+        """
+        return {"id": self.id, "duration": self.duration, "muted": self.muted}
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             return self.id == other.id
@@ -322,7 +324,7 @@ class MpegSegment(Segment):
         :rtype: MpegSegment
         """
         return MpegSegment(
-            int(re.sub(r".ts|-[a-zA-Z]*.ts", "", segment.uri)),
+            int(_SEGMENT_SUFFIX_PATTERN.sub("", segment.uri)),
             segment.duration,
             f"{base_url}{segment.uri}",
             "muted" in segment.uri,
@@ -6,22 +6,37 @@ import hashlib
 import json
 import logging
 import os
-import re
 import shutil
 import sys
 import tempfile
+import threading
 from datetime import datetime, timezone
 from itertools import groupby
 from math import ceil, floor
 from pathlib import Path
 from textwrap import dedent
+from time import time
 
 import requests
 
+# orjson is used for parsing and writing large JSON payloads (such as chat logs) if it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from twitcharchiver.twitch import Chapters
 
 log = logging.getLogger()
 
+# translation table replacing characters which aren't allowed in directory / file names:
+#   / \ : | < > " ? * 0x0-0x1f 0x27
+#                       ^        ^
+#                  ASCII Codes   '
+_UNSAFE_CHARS = str.maketrans(
+    dict.fromkeys('/\\:|<>"?*\x27' + "".join(map(chr, range(0x20))), "_")
+)
+
 
 def build_output_dir_name(title: str, created_at: float, vod_id: int = 0):
     """
@@ -133,11 +148,7 @@ def sanitize_text(string: str):
     if not string:
         return ""
 
-    # pattern matches:
-    #   / \ : | < > " ? 0x0-0x1f 0x27
-    #                     ^        ^
-    #                ASCII Codes   '
-    return re.sub(r'[/\\:|<>"?*\0-\x1f\x27]', "_", string)
+    return string.translate(_UNSAFE_CHARS)
 
 
 def sanitize_date(date):
@@ -190,10 +201,8 @@ def time_since_date(timestamp: float):
     :param timestamp: utc timestamp to compare current datetime to
     :return: the time in seconds since the given date
     """
-    created_at = int(timestamp)
-    current_time = int(datetime.now(timezone.utc).timestamp())
-
-    return current_time - created_at
+    # time() is already a utc timestamp, avoiding the construction of an aware datetime on every call
+    return int(time()) - int(timestamp)
 
 
 def get_time_difference(start_time, end_time):
@@ -216,6 +225,18 @@ def parse_twitch_timestamp(timestamp):
     :return: interpreted timestamp
     :rtype: float
     """
+    # fromisoformat is much faster than strptime, but before python 3.11 it only accepts fractions of a second
+    # which are 3 or 6 digits long, so fall back to strptime for anything it can't parse
+    if timestamp.endswith("Z"):
+        try:
+            return (
+                datetime.fromisoformat(timestamp[:-1])
+                .replace(tzinfo=timezone.utc)
+                .timestamp()
+            )
+        except ValueError:
+            pass
+
     # older twitch timestamps may include microseconds
     if "." in timestamp:
         return (
@@ -231,12 +252,25 @@ def parse_twitch_timestamp(timestamp):
         )
 
 
-def get_latest_version():
+def get_latest_version(cache_file: Path = None):
     """Fetches the latest release information from GitHub.
 
+    :param cache_file: optional file used to cache release information for 24 hours
     :return: latest version number
     :return: latest release notes
     """
+    # use cached release information if it was retrieved within the last day
+    if cache_file:
+        try:
+            if time() - os.path.getmtime(cache_file) < 86400:
+                with open(cache_file, "r", encoding="utf8") as _f:
+                    latest_version, release_notes = json.load(_f)
+
+                return latest_version, release_notes
+
+        except (OSError, TypeError, ValueError):
+            pass
+
     try:
         _r = requests.get(
             "https://api.github.com/repos/Brisppy/twitch-vod-archiver/releases/latest",
@@ -245,13 +279,23 @@ def get_latest_version():
         # catch error codes such as 403 in case of rate limiting
         if _r.status_code != 200:
             return "0.0.0", ""
-        latest_version = _r.json()["tag_name"].replace("v", "")
-        release_notes = _r.json()["body"]
+        _release = _r.json()
+        latest_version = _release["tag_name"].replace("v", "")
+        release_notes = _release["body"]
 
     # return a dummy value if request fails
     except Exception:
         return "0.0.0", ""
 
+    if cache_file:
+        try:
+            Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w", encoding="utf8") as _f:
+                json.dump([latest_version, release_notes], _f)
+
+        except OSError as exc:
+            log.debug("Failed to cache latest version information. Error: %s", exc)
+
     return latest_version, release_notes
 
 
@@ -374,11 +418,25 @@ def safe_move(src_file, dst_file):
             log.debug("%s already exists and matches %s.", dst_file, src_file)
             os.remove(src_file)
         else:
+            # rename directly if both paths are on the same filesystem, avoiding a copy
+            try:
+                os.replace(src_file, dst_file)
+                return
+
+            # fall back to copying if the paths are on different filesystems
+            except OSError:
+                pass
+
             if dst_exists:
                 os.remove(dst_file)
 
-            # generate temp file path and copy source file to it
-            tmp_file = Path(Path(dst_file.parent), os.urandom(6).hex())
+            # generate temp file path and copy source file to it, the name only has to be unique between the
+            # processes and threads which may be moving files concurrently
+            dst_file = Path(dst_file)
+            tmp_file = Path(
+                dst_file.parent,
+                f".{dst_file.name}.{os.getpid()}.{threading.get_ident()}.tmp",
+            )
             shutil.copyfile(src_file, tmp_file)
 
             # rename temp file
@@ -464,27 +522,44 @@ def write_file(data: str, file: Path):
         log.error('Failed to write data to "%s". Error: %s', Path(file), exc)
 
 
-def write_file_line_by_line(data: list, file: Path):
+def write_file_line_by_line(data: list, file: Path, append: bool = False):
     """
     Writes data to the provided file with each list element on a new line.
 
     :param data: list to write to file
     :type data: list
-    :param file: Path of output file (will be overwritten)
+    :param file: Path of output file
     :type file: Path
+    :param append: append to the file rather than overwriting it
+    :type append: bool
+    :return: True if data was written successfully
+    :rtype: bool
     """
     try:
-        # delete existing file as we must append to it
-        if Path(file).is_file():
-            Path(file).unlink()
+        # write each element on its own line, truncating any existing file unless appending
+        with open(Path(file), "a" if append else "w", encoding="utf-8") as _f:
+            _f.writelines(f"{_element}\n" for _element in data)
 
-        # write each message line by line to readable log
-        with open(Path(file), "a+", encoding="utf-8") as _f:
-            for _element in data:
-                _f.write(f"{_element}\n")
+        return True
 
     except Exception as exc:
         log.error('Failed to write data to "%s". Error: %s', Path(file), exc)
+        return False
+
+
+def json_loads(data):
+    """
+    Deserializes a JSON document, using orjson if it is available.
+
+    :param data: JSON document to parse
+    :type data: str | bytes
+    :return: parsed JSON data
+    :rtype: dict | list
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
 
 
 def write_json_file(data, file: Path):
@@ -497,8 +572,21 @@ def write_json_file(data, file: Path):
     :type file: Path
     """
     try:
-        with open(Path(file), "w", encoding="utf8") as _f:
-            _f.write(json.dumps(data, default=str))
+        if orjson is not None:
+            with open(Path(file), "wb") as _f:
+                # datetimes are passed through to str() to match the stdlib output
+                _f.write(
+                    orjson.dumps(
+                        data,
+                        default=str,
+                        option=orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME,
+                    )
+                )
+
+        else:
+            with open(Path(file), "w", encoding="utf8") as _f:
+                _f.write(json.dumps(data, default=str))
 
     except Exception as exc:
         log.error('Failed to write json data to "%s". Error: %s', Path(file), exc)
@@ -2,7 +2,9 @@
 Class for retrieving and storing a Twitch VOD and its associated information.
 """
 
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from random import randrange
 from time import sleep
@@ -110,10 +112,8 @@ class Vod:
         # use published_at as created_at if not provided
         if "createdAt" in vod_info.keys():
             self.created_at = parse_twitch_timestamp(vod_info["createdAt"])
-        elif "publishedAt" in vod_info.keys():
-            self.created_at = self.created_at = parse_twitch_timestamp(
-                vod_info["publishedAt"]
-            )
+        else:
+            self.created_at = self.published_at
 
         # set description if provided
         if "description" in vod_info.keys():
@@ -523,19 +523,6 @@ class Vod:
         )
         return ""
 
-    def get_index_playlist(self, index_url: str):
-        """
-        Retrieves the playlist for a given VOD index along with updating the VOD duration.
-
-        :param index_url: url for playlist
-        :type index_url: str
-        :return: playlist of video segments
-        :rtype str:
-        """
-        _vod_playlist = self._api.get_request(index_url).text
-
-        return _vod_playlist
-
     @staticmethod
     def get_quality_index(desired_quality, available_qualities):
         """Finds the index of a user defined quality from a list of available stream qualities.
@@ -661,20 +648,28 @@ class ArchivedVod(Vod):
         :return: dict of all VOD information
         :rtype: dict
         """
+        # chapters and muted segments are separate requests to Twitch, so retrieve them concurrently
+        with ThreadPoolExecutor(max_workers=1) as _worker_pool:
+            _muted_segments = _worker_pool.submit(self.get_muted_segments)
+            _chapters = str(self.chapters)
+            # stored as json so the column can be parsed again if needed
+            _muted_segments = json.dumps(
+                [_s.to_dict() for _s in _muted_segments.result()]
+            )
 
         return {
             "vod_id": self.v_id,
             "stream_id": self._s_id,
             "user_id": self.channel.id,
             "user_name": self.channel.name,
-            "chapters": str(self.chapters),
+            "chapters": _chapters,
             "title": self.title,
             "description": self.description,
             "created_at": datetime.utcfromtimestamp(self.created_at),
             "published_at": datetime.utcfromtimestamp(self.published_at),
             "thumbnail_url": self.thumbnail_url,
             "duration": self.duration,
-            "muted_segments": str(self.get_muted_segments()),
+            "muted_segments": _muted_segments,
             "chat_archived": self.chat_archived,
             "video_archived": self.video_archived,
         }